@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Compare the read and write throughput of compressed and plain translated
+text fields
+
+Run from the tests directory: ``./benchmark_compression.py [--rows 1000]``
+"""
+
+import argparse
+import os
+import sys
+import time
+from os.path import abspath, dirname
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--length", type=int, default=5000)
+    parser.add_argument("--codec", default="zlib")
+    args = parser.parse_args()
+
+    # Never touch other databases, rows are deleted below
+    os.environ["DJANGO_SETTINGS_MODULE"] = "testapp.settings"
+    sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+    import django  # noqa: PLC0415
+
+    django.setup()
+
+    from django.db import connection  # noqa: PLC0415
+    from django.utils.translation import override  # noqa: PLC0415
+    from testapp.models import CompressedModel  # noqa: PLC0415
+
+    connection.creation.create_test_db(verbosity=0)
+    if not connection.is_in_memory_db():
+        sys.exit("The benchmark only runs using an in-memory SQLite database.")
+    for language in ["en", "de"]:
+        CompressedModel._meta.get_field(f"description_{language}").codec = args.codec
+
+    words = [
+        "lorem",
+        "ipsum",
+        "dolor",
+        "sit",
+        "amet",
+        "consectetur",
+        "adipiscing",
+        "elit",
+    ]
+    text = " ".join(words[i % len(words)] for i in range(args.length // 6))
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<28} {args.rows / elapsed:>10.0f} rows/s")
+
+    for prefix in ["plain_description", "description"]:
+        CompressedModel.objects.all().delete()
+        timed(
+            f"write {prefix}",
+            lambda prefix=prefix: CompressedModel.objects.bulk_create(
+                CompressedModel(**{f"{prefix}_en": text, f"{prefix}_de": text})
+                for _ in range(args.rows)
+            ),
+        )
+
+        def read(prefix=prefix):
+            with override("en"):
+                for obj in CompressedModel.objects.only(f"{prefix}_en"):
+                    getattr(obj, prefix)
+
+        timed(f"read {prefix}", read)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT SUM(LENGTH({prefix}_en) + LENGTH({prefix}_de))"
+                f" FROM {CompressedModel._meta.db_table}"
+            )
+            print(f"{'stored characters':<28} {cursor.fetchone()[0]:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ class TestModelAdmin(TranslatedFieldAdmin, admin.ModelAdmin):
     list_display_links = ["name_en"]
     list_editable = ["name_de"]
     readonly_fields = [*models.TestModel.other.fields]
+    search_fields = ["name", "=other"]
+    ordering = ["name"]
 
 
 @admin.register(models.ListDisplayModel)
@@ -2,7 +2,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from testapp.custom_fields import ChoicesCharField, CustomPathTextField
-from translated_fields import TranslatedField
+from translated_fields import TranslatedField, TranslatedQuerySet
 
 
 class RelatedModel(models.Model):
@@ -96,6 +96,8 @@ class FieldTypesModel(models.Model):
         )
     )
 
+    objects = TranslatedQuerySet.as_manager()
+
     def __str__(self):
         return self.char_field
 
@@ -2,10 +2,17 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from translated_fields import (
+    BatchedDeferredLoadingMixin,
+    DirtyTrackingMixin,
+    FromTranslationsMixin,
+    ServedLanguagesManagerMixin,
     TranslatedField,
     TranslatedFieldWithFallback,
+    TranslatedQuerySet,
     translated_attributes,
 )
+from translated_fields.compression import CompressedTextField
+from translated_fields.storage import ContentAddressedStorage
 from translated_fields.utils import fallback_to_any, fallback_to_default
 
 
@@ -71,7 +78,13 @@ class ListDisplayModel(models.Model):
         return self.name
 
 
-class ModelWithFallback(models.Model):
+class ServedLanguagesManager(
+    ServedLanguagesManagerMixin, models.Manager.from_queryset(TranslatedQuerySet)
+):
+    pass
+
+
+class ModelWithFallback(BatchedDeferredLoadingMixin, models.Model):
     required = TranslatedFieldWithFallback(
         models.CharField(_("required"), max_length=20)
     )
@@ -79,6 +92,8 @@ class ModelWithFallback(models.Model):
         models.CharField(_("optional"), max_length=20, blank=True)
     )
 
+    objects = ServedLanguagesManager()
+
     def __str__(self):
         return self.required
 
@@ -89,5 +104,131 @@ class ModelWithAnyFallback(models.Model):
         attrgetter=fallback_to_any,
     )
 
+    objects = ServedLanguagesManager()
+
     def __str__(self):
         return self.optional
+
+
+class TrackedModel(FromTranslationsMixin, DirtyTrackingMixin, models.Model):
+    name = TranslatedField(models.CharField(_("name"), max_length=200))
+    other = TranslatedField(
+        models.CharField(_("other field"), max_length=200, blank=True)
+    )
+    ordering = models.IntegerField(_("ordering"), default=0)
+
+    objects = TranslatedQuerySet.as_manager()
+
+    def __str__(self):
+        return self.name
+
+
+class ResolvedModel(models.Model):
+    name = TranslatedFieldWithFallback(
+        models.CharField(_("name"), max_length=200), resolved=True
+    )
+
+    objects = TranslatedQuerySet.as_manager()
+
+    def __str__(self):
+        return self.name
+
+
+class SourceTrackedModel(DirtyTrackingMixin, models.Model):
+    name = TranslatedField(
+        models.CharField(_("name"), max_length=200, blank=True), track_sources=True
+    )
+    other = TranslatedField(models.CharField(_("other"), max_length=200, blank=True))
+
+    objects = TranslatedQuerySet.as_manager()
+
+    def __str__(self):
+        return self.name
+
+
+class AliasModel(models.Model):
+    name = TranslatedField(
+        models.CharField(_("name"), max_length=200),
+        languages=("en", "de", "de-ch"),
+        aliases={"en-gb": "en", "de-at": "de", "de-ch": "de"},
+        alias_overrides=["de-ch"],
+    )
+    other = TranslatedFieldWithFallback(
+        models.CharField(_("other field"), max_length=200),
+        aliases={"de-at": "de"},
+    )
+
+    objects = TranslatedQuerySet.as_manager()
+
+    def __str__(self):
+        return self.name
+
+
+class InheritingModel(models.Model):
+    name = TranslatedFieldWithFallback(
+        models.CharField(_("name"), max_length=200), inherit_primary=True
+    )
+
+    def __str__(self):
+        return self.name
+
+
+class ChoicesModel(models.Model):
+    choice = TranslatedField(
+        models.CharField(
+            _("choice"), max_length=3, choices=[("a", "Andrew"), ("b", "Betty")]
+        ),
+        {"de": {"choices": [("a", "Andreas"), ("b", "Bettina")]}},
+    )
+
+    def __str__(self):
+        return self.get_choice_display()
+
+
+class DocumentModel(models.Model):
+    file = TranslatedField(
+        models.FileField(
+            _("file"), upload_to="documents", storage=ContentAddressedStorage()
+        ),
+        {"de": {"blank": True}},
+    )
+
+    def __str__(self):
+        return self.file.name
+
+
+class PackedModel(models.Model):
+    name = TranslatedField(models.CharField(_("name"), max_length=200, blank=True))
+    is_active = TranslatedField(
+        models.BooleanField(_("is active"), default=True), packed=True
+    )
+    is_featured = TranslatedField(models.BooleanField(_("is featured")), packed=True)
+
+    def __str__(self):
+        return self.name
+
+
+class CompressedModel(DirtyTrackingMixin, models.Model):
+    description = TranslatedField(
+        CompressedTextField(_("description"), blank=True, threshold=100)
+    )
+    plain_description = TranslatedField(
+        models.TextField(_("plain description"), blank=True)
+    )
+
+    def __str__(self):
+        return self.description[:50]
+
+
+class SearchModel(models.Model):
+    name = TranslatedField(
+        models.CharField(_("name"), max_length=200, blank=True), searchable=True
+    )
+    description = TranslatedField(
+        models.TextField(_("description"), blank=True), searchable=True
+    )
+
+    objects = TranslatedQuerySet.as_manager()
+
+    def __str__(self):
+        return self.name
@@ -12,6 +12,7 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "django.contrib.messages",
     "testapp",
+    "translated_fields",
 ]
 
 MEDIA_URL = "/media/"
@@ -0,0 +1,96 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.utils.translation import override
+
+from testapp.models import CompressedModel
+from translated_fields.compression import (
+    MARKER,
+    CompressedTextField,
+    compress,
+    decompress,
+    recompress,
+)
+
+
+LONG = "Lorem ipsum dolor sit amet. " * 20
+
+
+def _stored(pk, *columns):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {', '.join(columns)} FROM {CompressedModel._meta.db_table}"
+            " WHERE id = %s",
+            [pk],
+        )
+        return cursor.fetchone()
+
+
+def test_codecs():
+    for codec in ["zlib", "bz2", "lzma"]:
+        compressed = compress(LONG, codec)
+        assert compressed.startswith(f"{MARKER}{codec}:")
+        assert decompress(compressed) == LONG
+    assert decompress("plain") == "plain"
+    assert decompress(None) is None
+    with pytest.raises(ValueError):
+        decompress(f"{MARKER}unknown:AAAA")
+
+
+def test_field():
+    with pytest.raises(ImproperlyConfigured):
+        CompressedTextField(codec="unknown")
+
+    field = CompressedTextField(codec="bz2", threshold=10)
+    assert field.deconstruct()[3] == {"codec": "bz2", "threshold": 10}
+    assert CompressedTextField().deconstruct()[3] == {}
+
+
+@pytest.mark.django_db
+def test_compressed_storage():
+    obj = CompressedModel.objects.create(
+        description_en=LONG,
+        description_de="Kurz",
+        plain_description_en=LONG,
+    )
+    en, de = _stored(obj.pk, "description_en", "description_de")
+    assert en.startswith(f"{MARKER}zlib:")
+    assert len(en) < len(LONG)
+    assert de == "Kurz"
+    assert _stored(obj.pk, "plain_description_en") == (LONG,)
+
+    # values() and values_list() return decompressed values too
+    assert CompressedModel.objects.values_list(
+        "description_en", "description_de", "plain_description_en"
+    ).get() == (LONG, "Kurz", LONG)
+    assert CompressedModel.objects.values("description_en").get() == {
+        "description_en": LONG
+    }
+
+    obj = CompressedModel.objects.get()
+    with override("en"):
+        assert obj.description == LONG
+    assert obj.changed_translations() == set()
+
+    # Plain values looking like compressed values survive
+    obj.description_de = f"{MARKER}zlib:not compressed"
+    obj.save()
+    obj = CompressedModel.objects.get()
+    assert obj.description_de == f"{MARKER}zlib:not compressed"
+
+
+@pytest.mark.django_db
+def test_recompress():
+    CompressedModel.objects.create(description_en="short")
+    obj = CompressedModel.objects.create(description_en=LONG)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {CompressedModel._meta.db_table} SET description_en = %s"
+            " WHERE id = %s",
+            [LONG, obj.pk],
+        )
+
+    assert recompress(CompressedModel, chunk_size=1) == 1
+    assert recompress(CompressedModel) == 0
+    assert _stored(obj.pk, "description_en") == (compress(LONG),)
+    assert CompressedModel.objects.get(pk=obj.pk).description_en == LONG
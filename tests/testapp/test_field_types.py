@@ -1,7 +1,7 @@
 from decimal import Decimal
 
 import pytest
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldError, ValidationError
 from django.forms import modelform_factory
 from django.utils.translation import override
 
@@ -279,3 +279,45 @@ def test_translated_accessors():
         assert model.url_field == "https://example.de"
         assert model.email_field == "de@example.de"
         assert model.decimal_field == Decimal("20.75")
+
+
+@pytest.mark.django_db
+def test_select_related_translated(django_assert_num_queries):
+    """Only the active and the fallback language's foreign keys are joined."""
+    rel_en = RelatedModel.objects.create(name="English Related")
+    rel_de = RelatedModel.objects.create(name="German Related")
+    FieldTypesModel.objects.create(foreign_key_en=rel_en, foreign_key_de=rel_de)
+
+    with override("de"):
+        qs = FieldTypesModel.objects.select_related_translated("foreign_key")
+        assert qs.query.select_related == {"foreign_key_de": {}, "foreign_key_en": {}}
+        with django_assert_num_queries(1):
+            assert [obj.foreign_key for obj in qs] == [rel_de]
+
+        qs = FieldTypesModel.objects.select_related_translated(
+            "foreign_key", fallback=False
+        )
+        assert qs.query.select_related == {"foreign_key_de": {}}
+
+    with override("fr"):
+        qs = FieldTypesModel.objects.select_related_translated("foreign_key")
+        assert qs.query.select_related == {"foreign_key_en": {}}
+
+    with pytest.raises(FieldError):
+        FieldTypesModel.objects.select_related_translated("char_field_en")
+
+
+@pytest.mark.django_db
+def test_prefetch_related_translated(django_assert_num_queries):
+    rel_en = RelatedModel.objects.create(name="English Related")
+    rel_de = RelatedModel.objects.create(name="German Related")
+    FieldTypesModel.objects.create(foreign_key_en=rel_en, foreign_key_de=rel_de)
+    FieldTypesModel.objects.create(foreign_key_en=rel_en)
+
+    with override("de"):
+        qs = FieldTypesModel.objects.prefetch_related_translated(
+            "foreign_key", queryset=RelatedModel.objects.only("name")
+        ).order_by("id")
+        with django_assert_num_queries(3):
+            assert [obj.foreign_key_de for obj in qs] == [rel_de, None]
+            assert [obj.foreign_key_en for obj in qs] == [rel_en, rel_en]
@@ -1,25 +1,53 @@
+import io
+import pickle
 import re
 
 import django
 import pytest
 from django import forms
+from django.contrib.admin import site
 from django.contrib.auth.models import User
-from django.core.exceptions import ValidationError
+from django.core.exceptions import (
+    FieldError,
+    ImproperlyConfigured,
+    ValidationError,
+)
 from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import connection, models
+from django.db.models.signals import pre_save
 from django.forms import modelform_factory
 from django.test import Client
+from django.test.utils import CaptureQueriesContext, isolate_apps
 from django.utils.translation import override
 from pytest_django.asserts import assertInHTML
 
+import translated_fields.fields
+from testapp.field_types_models import FieldTypesModel, RelatedModel
 from testapp.models import (
+    AliasModel,
+    ChoicesModel,
     CustomLanguagesModel,
+    InheritingModel,
     ListDisplayModel,
     ModelWithAnyFallback,
     ModelWithFallback,
+    PackedModel,
+    ResolvedModel,
+    SourceTrackedModel,
     SpecificModel,
     TestModel,
+    TrackedModel,
+)
+from translated_fields import (
+    TranslatedField,
+    cached_attrgetter,
+    language_code_formfield_callback,
+    source_hash,
+    to_attribute,
+    translated_modelform_factory,
 )
-from translated_fields import language_code_formfield_callback
+from translated_fields.signals import translations_changed
 
 
 @pytest.fixture
@@ -135,8 +163,8 @@ def test_admin(login):
     m = TestModel.objects.create(name_en="Test")
 
     response = client.get("/admin/testapp/testmodel/")
-    assert "<span>Name</span>" in response.content.decode()
-    assert "<span>Other field</span>" in response.content.decode()
+    assert '<a href="?o=1">Name</a>' in response.content.decode()
+    assert '<a href="?o=2">Other field</a>' in response.content.decode()
 
     assert "Name [en]</a>" in response.content.decode()
     assert "Name [de]</a>" in response.content.decode()
@@ -316,3 +344,905 @@ def test_formfield_callback():
         result = str(Form())
         assert "Anderes Feld [en]:" in result
         assert "Anderes Feld [de]:" in result
+
+
+@pytest.mark.django_db
+def test_admin_deferred_rendering(rf, admin_user):
+    TestModel.objects.create(name_en="Test")
+    model_admin = site._registry[TestModel]
+    request = rf.get("/")
+    request.user = admin_user
+
+    response = model_admin.changelist_view(request)
+    assert not response.is_rendered
+    response.context_data["title"] = "Deferred"
+    response.render()
+    assert "Deferred" in response.content.decode()
+    assert "Name [en]</a>" in response.content.decode()
+
+    response = model_admin.changeform_view(request)
+    assert not response.is_rendered
+    assert "Name [de]" in response.render().content.decode()
+
+    # Labels are cached per language and flag
+    label = TestModel._meta.get_field("name_de").verbose_name
+    assert str(label) == "name"
+    with translated_fields.fields.show_language_code(True):  # noqa: FBT003
+        assert str(label) == "Name [de]"
+        with override("de"):
+            assert str(label) == "Name [de]"
+
+
+@pytest.mark.django_db
+def test_admin_search_fields(login, rf, user):
+    TestModel.objects.create(name_en="Apple", name_de="Apfel", other_de="Birne")
+
+    def result_count(url):
+        response = login.get(url)
+        assert response.status_code == 200
+        return response.context["cl"].result_count
+
+    assert result_count("/admin/testapp/testmodel/?q=apple") == 1
+    assert result_count("/admin/testapp/testmodel/?q=apfel") == 0
+    assert result_count("/admin/testapp/testmodel/?q=apfel&_all_languages=1") == 1
+    assert result_count("/admin/testapp/testmodel/?q=birne") == 0
+    assert result_count("/admin/testapp/testmodel/?q=Birne&_all_languages=1") == 1
+
+    model_admin = site._registry[TestModel]
+    request = rf.get("/")
+    request.user = user
+    with override("de"):
+        assert model_admin.get_search_fields(request) == ["name_de", "=other_de"]
+    with override("fr"):
+        assert model_admin.get_search_fields(request) == ["name_en", "=other_en"]
+
+    model_admin.translated_search_languages = ["de"]
+    try:
+        assert model_admin.get_search_fields(request) == ["name_de", "=other_de"]
+    finally:
+        del model_admin.translated_search_languages
+
+
+@pytest.mark.django_db
+def test_admin_translated_ordering(login):
+    TestModel.objects.create(name_en="A", name_de="Z")
+    TestModel.objects.create(name_en="B", name_de="Y")
+
+    model_admin = site._registry[TestModel]
+    assert model_admin.check() == []
+    model_admin.ordering = ["-name", "unknown"]
+    try:
+        assert [error.id for error in model_admin.check()] == ["admin.E033"]
+    finally:
+        del model_admin.ordering
+
+    response = login.get("/admin/testapp/testmodel/")
+    assert [obj.name_en for obj in response.context["cl"].result_list] == ["A", "B"]
+
+    response = login.get("/admin/testapp/testmodel/", HTTP_ACCEPT_LANGUAGE="de")
+    assert [obj.name_en for obj in response.context["cl"].result_list] == ["B", "A"]
+
+    response = login.get("/admin/testapp/testmodel/?o=-1")
+    assert [obj.name_en for obj in response.context["cl"].result_list] == ["B", "A"]
+
+
+@pytest.mark.django_db
+def test_admin_changelist_only_displayed_fields(login):
+    TestModel.objects.create(name_en="A", name_de="Z")
+
+    response = login.get("/admin/testapp/testmodel/", HTTP_ACCEPT_LANGUAGE="de")
+    cl = response.context["cl"]
+    assert cl.get_list_display_fields() == [
+        "name_de",
+        "name_en",
+        "other_de",
+        "other_en",
+    ]
+    assert cl.result_list[0].get_deferred_fields() == set()
+
+    response = login.get("/admin/testapp/testmodel/")
+    cl = response.context["cl"]
+    assert cl.get_list_display_fields() == ["name_en", "other_en", "name_de"]
+    assert cl.result_list[0].get_deferred_fields() == {"other_de"}
+
+    # Admin methods may access any field
+    response = login.get("/admin/testapp/listdisplaymodel/")
+    assert response.context["cl"].get_list_display_fields() is None
+
+    # Relations of select_related() aren't deferred
+    related = RelatedModel.objects.create(name="related")
+    FieldTypesModel.objects.create(char_field_en="a", foreign_key_en=related)
+    model_admin = site._registry[FieldTypesModel]
+    model_admin.list_select_related = ["foreign_key_en"]
+    try:
+        response = login.get("/admin/testapp/fieldtypesmodel/")
+    finally:
+        del model_admin.list_select_related
+    obj = response.context["cl"].result_list[0]
+    assert obj.get_deferred_fields() >= {"int_field_en", "bool_field_de"}
+    assert "foreign_key_en" not in obj.get_deferred_fields()
+    assert obj.foreign_key_en.name == "related"
+
+
+@pytest.mark.django_db
+def test_admin_changeform_languages(login, monkeypatch):
+    m = TestModel.objects.create(name_en="A", name_de="B")
+    url = f"/admin/testapp/testmodel/{m.id}/change/"
+
+    response = login.get(url)
+    assert 'name="name_en"' in response.content.decode()
+    assert 'name="name_de"' in response.content.decode()
+
+    response = login.get(f"{url}?_languages=de")
+    assert 'name="name_en"' not in response.content.decode()
+    assert 'name="name_de"' in response.content.decode()
+    assert "Other field [de]" in response.content.decode()
+    assert "Other field [en]" not in response.content.decode()
+    form_class = response.context["adminform"].form.__class__
+
+    # The selection is remembered and form classes are cached
+    response = login.get(url)
+    assert 'name="name_en"' not in response.content.decode()
+    assert response.context["adminform"].form.__class__ is form_class
+
+    # Values of shown languages which are set outside the form are saved too
+    model_admin = site._registry[TestModel]
+
+    def save_model(request, obj, form, change):
+        obj.other_de = "Saved"
+        obj.other_en = "Ignored"
+        type(model_admin).save_model(model_admin, request, obj, form, change)
+
+    monkeypatch.setattr(model_admin, "save_model", save_model)
+    with CaptureQueriesContext(connection) as queries:
+        response = login.post(url, {"name_de": "C"})
+    assert response.status_code == 302
+    updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+    assert len(updates) == 1
+    assert '"name_de"' in updates[0]
+    assert '"name_en"' not in updates[0]
+
+    m.refresh_from_db()
+    assert (m.name_en, m.name_de) == ("A", "C")
+    assert (m.other_en, m.other_de) == ("", "Saved")
+    monkeypatch.undo()
+
+    # Reset the selection
+    response = login.get(f"{url}?_languages=")
+    assert 'name="name_en"' in response.content.decode()
+
+    # Adding objects always shows all languages
+    response = login.get("/admin/testapp/testmodel/add/?_languages=de")
+    assert 'name="name_en"' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_served_languages(django_assert_num_queries, settings):
+    ModelWithFallback.objects.create(required_en="en", required_de="de")
+    ModelWithAnyFallback.objects.create(optional_de="de")
+
+    obj = ModelWithFallback.objects.get()
+    assert obj.get_deferred_fields() == set()
+
+    settings.TRANSLATED_FIELDS_SERVED_LANGUAGES = ["en"]
+    obj = ModelWithFallback.objects.get()
+    assert obj.get_deferred_fields() == {"required_de", "optional_de"}
+    with django_assert_num_queries(0):
+        with override("de"):
+            assert obj.required == "en"
+        with override(None):
+            assert obj.required == "en"
+
+    obj = ModelWithAnyFallback.objects.get()
+    with django_assert_num_queries(0), override("de"):
+        assert obj.optional == ""
+
+    settings.TRANSLATED_FIELDS_SERVED_LANGUAGES = ["de"]
+    obj = ModelWithFallback.objects.get()
+    assert obj.get_deferred_fields() == {"required_en", "optional_en"}
+    with django_assert_num_queries(0):
+        with override("de"):
+            assert obj.required == "de"
+        with override("en"):
+            assert obj.required == "de"
+
+    # Computed once per field until the setting changes
+    served = translated_fields.fields._served_languages
+    assert served[ModelWithFallback.required] == ["de"]
+    settings.TRANSLATED_FIELDS_SERVED_LANGUAGES = None
+    assert ModelWithFallback.required not in served
+
+
+@pytest.mark.django_db
+def test_batched_deferred_loading_pickle():
+    for i in range(2):
+        ModelWithFallback.objects.create(required_en=f"en{i}", required_de=f"de{i}")
+
+    queryset = ModelWithFallback.objects.only("required_en").order_by("pk")
+    objs = list(queryset)
+    obj = pickle.loads(pickle.dumps(objs[0]))
+    assert obj.required_de == "de0"
+    assert [obj.required_de for obj in pickle.loads(pickle.dumps(queryset))] == [
+        "de0",
+        "de1",
+    ]
+    # The original instances are still loaded together
+    assert "_translated_peers" in objs[0].__dict__
+
+
+@pytest.mark.django_db
+def test_batched_deferred_loading(django_assert_num_queries):
+    for i in range(3):
+        ModelWithFallback.objects.create(required_en=f"en{i}", required_de=f"de{i}")
+
+    objs = list(
+        ModelWithFallback.objects.defer("required_de", "optional_de").order_by("pk")
+    )
+    with django_assert_num_queries(1):
+        assert [obj.required_de for obj in objs] == ["de0", "de1", "de2"]
+    with django_assert_num_queries(1):
+        assert [obj.optional_de for obj in objs] == ["", "", ""]
+
+    # Objects which have been loaded separately aren't batched
+    objs = [
+        ModelWithFallback.objects.defer("required_de").get(pk=obj.pk) for obj in objs
+    ]
+    with django_assert_num_queries(3):
+        assert [obj.required_de for obj in objs] == ["de0", "de1", "de2"]
+
+
+@pytest.mark.django_db
+def test_translated_modelform():
+    form_class = translated_modelform_factory(ModelWithFallback, languages=["de"])
+    assert (
+        translated_modelform_factory(ModelWithFallback, languages=["de"]) is form_class
+    )
+    assert list(form_class.base_fields) == ["required_de", "optional_de"]
+    assert "Required [de]" in str(form_class())
+
+    form_class = translated_modelform_factory(ModelWithFallback)
+    assert list(form_class.base_fields) == [
+        "required_en",
+        "required_de",
+        "optional_en",
+        "optional_de",
+    ]
+
+    # Existing data which doesn't validate anymore...
+    obj = ModelWithFallback.objects.create(required_en="", optional_de="x")
+    data = {"required_en": "", "required_de": "", "optional_en": "", "optional_de": "y"}
+    form = form_class(data, instance=obj)
+    # ... isn't validated if it hasn't been changed
+    assert form.is_valid(), form.errors
+    assert list(form.cleaned_data) == ["optional_de"]
+
+    with CaptureQueriesContext(connection) as queries:
+        form.save()
+    assert len(queries) == 1
+    assert '"optional_de"' in queries[0]["sql"]
+    assert '"required_en"' not in queries[0]["sql"]
+
+    obj.refresh_from_db()
+    assert obj.optional_de == "y"
+
+    form = form_class({**data, "required_en": "x" * 30}, instance=obj)
+    assert not form.is_valid()
+    assert list(form.errors) == ["required_en"]
+
+    # Adding objects validates everything
+    form = form_class(data)
+    assert not form.is_valid()
+    assert list(form.errors) == ["required_en"]
+
+
+@pytest.mark.django_db
+def test_translated_modelform_saves_untranslated_fields(monkeypatch):
+    obj = TrackedModel.objects.create(name_en="a", name_de="b")
+    TrackedModel.objects.filter(pk=obj.pk).update(other_de="unchanged")
+
+    def clean(self):
+        self.ordering = 5
+
+    monkeypatch.setattr(TrackedModel, "clean", clean)
+    form_class = translated_modelform_factory(TrackedModel, fields=["name_en"])
+    form = form_class({"name_en": "c"}, instance=obj)
+    assert form.is_valid(), form.errors
+    form.save()
+    obj = TrackedModel.objects.get()
+    # Values set in Model.clean() are saved, unchanged translations are not
+    assert (obj.name_en, obj.ordering, obj.other_de) == ("c", 5, "unchanged")
+
+
+@pytest.mark.django_db
+def test_admin_translation_grid(login, monkeypatch):
+    monkeypatch.setattr(site._registry[TestModel], "translation_grid_per_page", 2)
+    objs = [TestModel.objects.create(name_en=f"Name {i}") for i in range(3)]
+    url = "/admin/testapp/testmodel/translate/"
+
+    response = login.get(url)
+    assert response.status_code == 200
+    assert response.context["source"] == "en"
+    assert response.context["target"] == "de"
+    assert len(response.context["rows"]) == 2
+    content = response.content.decode()
+    assert "<td>Name 0</td>" in content
+    assert 'name="form-0-name_de"' in content
+    # other_* are read-only
+    assert 'name="form-0-other_de"' not in content
+    assert 'name="form-0-name_en"' not in content
+
+    response = login.get(f"{url}?source=de&target=en&p=2")
+    assert [form.instance for form, _cells in response.context["rows"]] == objs[2:]
+    assert 'name="form-0-name_en"' in response.content.decode()
+
+    assert login.get(f"{url}?target=fr").status_code == 404
+
+    data = {
+        "form-TOTAL_FORMS": "2",
+        "form-INITIAL_FORMS": "2",
+        "form-0-id": str(objs[0].pk),
+        "form-0-name_de": "Name null",
+        "form-0-other_de": "Ignored",
+        "form-1-id": str(objs[1].pk),
+        "form-1-name_de": "",
+    }
+    with CaptureQueriesContext(connection) as queries:
+        response = login.post(url, data)
+    assert response.status_code == 302
+    assert response.url == url
+    updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+    assert len(updates) == 1
+    assert list(TestModel.objects.order_by("pk").values_list("name_de", flat=True)) == [
+        "Name null",
+        "",
+        "",
+    ]
+    assert set(TestModel.objects.values_list("other_de", flat=True)) == {""}
+
+
+@pytest.mark.django_db
+def test_dirty_tracking():
+    received = []
+
+    def receiver(sender, instance, changes, **kwargs):
+        received.append(changes)
+
+    translations_changed.connect(receiver, sender=TrackedModel)
+    try:
+        obj = TrackedModel.objects.create(name_en="a", name_de="b")
+        assert received == [
+            {("name", "en"), ("name", "de"), ("other", "en"), ("other", "de")}
+        ]
+
+        obj = TrackedModel.objects.get()
+        assert obj.changed_translations() == set()
+        with override("de"):
+            obj.name = "c"
+        obj.ordering = 3
+        assert obj.changed_translations() == {("name", "de")}
+
+        with CaptureQueriesContext(connection) as queries:
+            obj.save()
+        (update,) = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        assert '"name_de"' in update
+        assert '"ordering"' in update
+        assert '"name_en"' not in update
+        assert '"other_de"' not in update
+        assert received[-1] == {("name", "de")}
+        assert obj.changed_translations() == set()
+
+        # Nothing changed, nothing reported
+        del received[:]
+        obj.save()
+        assert received == []
+
+        # Explicit update_fields are respected
+        obj.name_en = "x"
+        obj.other_en = "y"
+        obj.save(update_fields=["name_en"])
+        assert received == [{("name", "en")}]
+        assert obj.changed_translations() == {("other", "en")}
+
+        # Deferred columns loaded later aren't written again
+        obj = TrackedModel.objects.defer("other_de").get()
+        obj.other_de  # noqa: B018
+        assert obj.changed_translations() == set()
+        obj.other_de = "z"
+        obj.save()
+        assert TrackedModel.objects.values_list(
+            "name_en", "name_de", "other_en", "other_de", "ordering"
+        ).get() == ("x", "c", "", "z", 3)
+    finally:
+        translations_changed.disconnect(receiver, sender=TrackedModel)
+
+
+@pytest.mark.django_db
+def test_dirty_tracking_insert():
+    TrackedModel.objects.create(name_en="a", name_de="b")
+
+    # Copying objects
+    obj = TrackedModel.objects.get()
+    obj.pk = None
+    obj.save()
+    assert obj.changed_translations() == set()
+    assert list(
+        TrackedModel.objects.order_by("pk").values_list("name_en", "name_de")
+    ) == [("a", "b"), ("a", "b")]
+
+    obj = TrackedModel.objects.get(pk=obj.pk)
+    obj.pk += 1
+    assert obj.changed_translations() == {
+        ("name", "en"),
+        ("name", "de"),
+        ("other", "en"),
+        ("other", "de"),
+    }
+    obj.save()
+    assert TrackedModel.objects.count() == 3
+
+    # Saving objects whose row has been deleted inserts them again
+    obj = TrackedModel.objects.get(pk=obj.pk)
+    TrackedModel.objects.filter(pk=obj.pk).delete()
+    obj.name_en = "c"
+    obj.save()
+    assert TrackedModel.objects.values_list("name_en", "name_de").get(pk=obj.pk) == (
+        "c",
+        "b",
+    )
+
+
+@pytest.mark.django_db
+def test_resolved_fields(django_assert_num_queries):
+    assert ResolvedModel.name.resolved_fields == {"de": "name_de_resolved"}
+    field = ResolvedModel._meta.get_field("name_de_resolved")
+    assert field.db_index
+    assert not field.editable
+
+    a = ResolvedModel.objects.create(name_en="b-en")
+    b = ResolvedModel.objects.create(name_en="a-en", name_de="c-de")
+    c = ResolvedModel.objects.create(name_en="c-en", name_de="a-de")
+
+    assert ResolvedModel.name.resolved_attribute("en") == "name_en"
+    with override("de"):
+        assert ResolvedModel.name.admin_order_field == "name_de_resolved"
+        assert list(ResolvedModel.objects.order_by("name_de_resolved")) == [c, a, b]
+        assert set(
+            ResolvedModel.objects.filter(
+                **{f"{ResolvedModel.name.resolved_attribute()}__endswith": "en"}
+            )
+        ) == {a}
+        assert list(ResolvedModel.objects.order_by_translated("-name", "pk")) == [
+            b,
+            a,
+            c,
+        ]
+        assert set(ResolvedModel.objects.filter_translated(name__endswith="en")) == {a}
+        assert set(ResolvedModel.objects.exclude_translated(name__endswith="en")) == {
+            b,
+            c,
+        }
+        assert list(
+            ResolvedModel.objects.with_language("en").order_by_translated("name")
+        ) == [b, a, c]
+
+        # The descriptor uses the resolved column if the column is deferred
+        objs = list(ResolvedModel.objects.defer("name_de").order_by("pk"))
+        with django_assert_num_queries(0):
+            assert [obj.name for obj in objs] == ["b-en", "c-de", "a-de"]
+
+        b.name_de = ""
+        b.save()
+        assert (
+            ResolvedModel.objects.values_list("name_de_resolved", flat=True).get(
+                pk=b.pk
+            )
+            == "a-en"
+        )
+
+    if translated_fields.fields.GeneratedField is not None:
+        # Generated columns are always computed by the database
+        assert ResolvedModel.objects.refresh_resolved() == 0
+        return
+
+    # Updates bypassing save() leave regular columns alone
+    ResolvedModel.objects.filter(pk=a.pk).update(name_de="z-de")
+    resolved = ResolvedModel.objects.filter(pk=a.pk).values_list(
+        "name_de_resolved", flat=True
+    )
+    assert resolved.get() == "b-en"
+    assert ResolvedModel.objects.refresh_resolved() == 3
+    assert resolved.get() == "z-de"
+    assert ResolvedModel.objects.refresh_resolved("name") == 3
+
+
+@isolate_apps("testapp")
+def test_resolved_fields_without_generated_field(monkeypatch):
+    monkeypatch.setattr(translated_fields.fields, "GeneratedField", None)
+
+    class Model(models.Model):
+        name = TranslatedField(models.CharField(max_length=20), resolved=["de"])
+
+        def __str__(self):
+            return self.name
+
+    field = Model._meta.get_field("name_de_resolved")
+    assert type(field) is models.CharField
+    assert field.db_index
+
+    obj = Model(name_en="en")
+    pre_save.send(sender=Model, instance=obj)
+    assert obj.name_de_resolved == "en"
+    obj.name_de = "de"
+    pre_save.send(sender=Model, instance=obj)
+    assert obj.name_de_resolved == "de"
+
+    pre_save.disconnect(
+        sender=Model, dispatch_uid="translated_fields_auxiliary_testapp.Model_name"
+    )
+
+
+@pytest.mark.django_db
+def test_source_tracking():
+    assert SourceTrackedModel.name.source_fields == {
+        "de": ("name_de_source", "name_de_stale")
+    }
+
+    a = SourceTrackedModel.objects.create(name_en="a", name_de="a-de")
+    b = SourceTrackedModel.objects.create(name_en="b")
+    assert a.name_de_source == source_hash("a")
+    assert len(a.name_de_source) == 16
+    assert b.name_de_source == ""
+    assert not SourceTrackedModel.objects.stale_translations("de").exists()
+
+    # Changing the source marks existing translations stale
+    a = SourceTrackedModel.objects.get(pk=a.pk)
+    a.name_en = "aa"
+    a.save()
+    b = SourceTrackedModel.objects.get(pk=b.pk)
+    b.name_en = "bb"
+    b.save()
+    assert list(SourceTrackedModel.objects.stale_translations("de")) == [a]
+    assert list(SourceTrackedModel.objects.stale_translations("de", "name")) == [a]
+    assert not SourceTrackedModel.objects.stale_translations("en").exists()
+
+    # Writing the translation marks it current
+    form_class = translated_modelform_factory(SourceTrackedModel)
+    form = form_class(
+        {"name_en": "aa", "name_de": "aa-de"},
+        instance=SourceTrackedModel.objects.get(pk=a.pk),
+    )
+    assert form.is_valid()
+    form.save()
+    assert not SourceTrackedModel.objects.stale_translations("de").exists()
+    a.refresh_from_db()
+    assert a.name_de_source == source_hash("aa")
+
+    # Computed columns are saved with the columns they depend on
+    obj = SourceTrackedModel.objects.get(pk=a.pk)
+    obj.name_en = "b"
+    obj.save(update_fields=["name_en"])
+    assert list(SourceTrackedModel.objects.stale_translations("de")) == [a]
+    obj.name_de = "b-de"
+    obj.save(update_fields=["name_de"])
+    assert not SourceTrackedModel.objects.stale_translations("de").exists()
+    obj.name_en = "aa"
+    obj.save()
+    obj.name_de = "aa-de"
+    obj.save()
+    a.refresh_from_db()
+
+    # Reverting the source makes the translation current again
+    a.name_en = "a"
+    a.save()
+    assert SourceTrackedModel.objects.stale_translations("de").exists()
+    a.name_en = "aa"
+    a.save()
+    assert not SourceTrackedModel.objects.stale_translations("de").exists()
+
+    with pytest.raises(FieldError):
+        SourceTrackedModel.objects.stale_translations("de", "other")
+
+
+@isolate_apps("testapp")
+def test_source_tracking_requires_dirty_tracking():
+    with pytest.raises(ImproperlyConfigured):
+
+        class Model(models.Model):
+            name = TranslatedField(models.CharField(max_length=20), track_sources=True)
+
+            def __str__(self):
+                return self.name
+
+
+@pytest.mark.django_db
+def test_from_translations(django_assert_num_queries):
+    obj = TrackedModel.from_translations(
+        name={"en": "Hello", "de": "Hallo"}, other={"de": "Welt"}, ordering=3
+    )
+    assert (obj.name_en, obj.name_de, obj.other_en, obj.other_de) == (
+        "Hello",
+        "Hallo",
+        "",
+        "Welt",
+    )
+    assert obj.ordering == 3
+    assert obj.pk is None
+
+    with pytest.raises(ValueError, match=r"name: fr, other: it"):
+        TrackedModel.objects.bulk_create_translated(
+            [{"name": {"fr": "Bonjour"}}, {"other": {"it": "Ciao"}}]
+        )
+
+    rows = ({"name": {"en": f"{i}", "de": f"{i}-de"}, "ordering": i} for i in range(5))
+    with django_assert_num_queries(3):
+        assert TrackedModel.objects.bulk_create_translated(rows, batch_size=2) == 5
+    assert list(
+        TrackedModel.objects.order_by("ordering").values_list("name_en", "name_de")
+    ) == [(f"{i}", f"{i}-de") for i in range(5)]
+
+
+def test_language_aliases(settings):
+    assert AliasModel.name.languages == ["en", "de", "de-ch"]
+    assert AliasModel.name.aliases == {"en-gb": "en", "de-at": "de", "de-ch": "de"}
+    assert AliasModel.name.alias_overrides == {"de-ch"}
+    assert AliasModel._meta.get_field("name_de_ch").blank
+    assert AliasModel.other.fields == ["other_en", "other_de"]
+
+    obj = AliasModel(name_en="colour", name_de="Strasse", other_de="Welt")
+    with override("en-gb"):
+        assert obj.name == "colour"
+        assert obj.other == ""
+    with override("de-at"):
+        assert obj.name == "Strasse"
+        assert obj.other == "Welt"
+        assert AliasModel.name.admin_order_field == "name_de"
+        obj.name = "Straße"
+    assert obj.name_de == "Straße"
+    with override("de-ch"):
+        assert obj.name == "Straße"
+        obj.name = "Strasse"
+        assert obj.name == "Strasse"
+    assert (obj.name_de, obj.name_de_ch) == ("Straße", "Strasse")
+
+    settings.LANGUAGES = [("en", "English"), ("en-gb", "British English")]
+    settings.TRANSLATED_FIELDS_LANGUAGE_ALIASES = {"en-gb": "en"}
+    field = TranslatedField(models.CharField(max_length=20))
+    assert field.languages == ["en"]
+    assert field.aliases == {"en-gb": "en"}
+    field = TranslatedField(models.CharField(max_length=20), alias_overrides=["en-gb"])
+    assert field.languages == ["en", "en-gb"]
+
+
+@pytest.mark.django_db
+def test_with_language(django_assert_num_queries):
+    AliasModel.objects.create(
+        name_en="en", name_de="de", name_de_ch="", other_en="en", other_de=""
+    )
+
+    with override("en"):
+        queryset = AliasModel.objects.with_language("de-ch")
+        # de-ch isn't an alias of other's languages, only the fallback remains
+        assert queryset.query.deferred_loading == (frozenset({"other_de"}), True)
+        queryset = AliasModel.objects.with_language("de")
+        assert queryset.query.deferred_loading == (frozenset({"name_de_ch"}), True)
+        with django_assert_num_queries(1):
+            (obj,) = queryset.filter(name_en="en")
+            assert obj.name == "de"
+            assert obj.other == "en"  # Fallback
+        obj.name = "neu"
+        assert obj.name_de == "neu"
+
+        (obj,) = queryset.with_language(None)
+        assert obj.name == "en"
+        assert [obj.name for obj in AliasModel.objects.with_language("de-ch")] == ["de"]
+
+
+@pytest.mark.django_db
+def test_inherit_primary():
+    assert InheritingModel._meta.get_field("name_de").null
+    assert not InheritingModel._meta.get_field("name_en").null
+
+    obj = InheritingModel.objects.create(name_en="same", name_de="same")
+    assert obj.name_de is None
+    with override("de"):
+        assert obj.name == "same"
+
+    # Bulk updates and rows written before enabling inherit_primary
+    InheritingModel.objects.update(name_de="same")
+    other = InheritingModel.objects.create(name_en="", name_de="")
+    InheritingModel.objects.create(name_en="a", name_de="b")
+
+    out = io.StringIO()
+    call_command("compact_translations", "testapp", chunk_size=2, stdout=out)
+    assert "testapp.InheritingModel: 1 translations compacted" in out.getvalue()
+    assert list(
+        InheritingModel.objects.order_by("pk").values_list("name_en", "name_de")
+    ) == [("same", None), ("", ""), ("a", "b")]
+
+    other.refresh_from_db()
+    with override("de"):
+        assert other.name == ""
+
+
+@pytest.mark.django_db
+def test_inherit_primary_forms():
+    field = InheritingModel._meta.get_field("name_de")
+    assert field.deconstruct()[1] == "django.db.models.CharField"
+    assert field.formfield().empty_value == ""
+
+    form_class = modelform_factory(InheritingModel, fields=["name_en", "name_de"])
+    obj = InheritingModel.objects.create(name_en="a", name_de="b")
+    form = form_class({"name_en": "a", "name_de": ""}, instance=obj)
+    assert form.is_valid()
+    form.save()
+    obj.refresh_from_db()
+    # Blank translations stay blank
+    assert obj.name_de == ""
+
+    obj = InheritingModel.objects.create(name_en="a", name_de="a")
+    assert obj.name_de is None
+    form = form_class({"name_en": "b", "name_de": ""}, instance=obj)
+    assert form.is_valid()
+    form.save()
+    obj.refresh_from_db()
+    # Inherited values keep inheriting
+    assert obj.name_de is None
+
+
+def test_get_display():
+    choices = ListDisplayModel.choice._display_choices
+    assert choices["en"] is choices["de"]
+    assert not hasattr(TestModel, "get_name_display")
+
+    obj = ListDisplayModel(choice_en="a", choice_de="b")
+    with override("en"):
+        assert obj.get_choice_display() == "Andrew"
+    with override("de"):
+        assert obj.get_choice_display() == "Betty"
+
+    obj = ChoicesModel(choice_en="a", choice_de="b")
+    with override("en"):
+        assert obj.get_choice_display() == "Andrew"
+        obj.choice_en = "x"
+        assert obj.get_choice_display() == "x"
+    with override("de"):
+        assert str(obj) == "Bettina"
+    # The per-language methods created by Django continue to work
+    assert obj.get_choice_de_display() == "Bettina"
+
+
+@pytest.mark.django_db
+def test_packed_booleans():
+    field = PackedModel._meta.get_field("is_active")
+    assert field.attname == field.column == "is_active_bits"
+    assert PackedModel.is_active.fields == ["is_active_en", "is_active_de"]
+    assert [f.name for f in PackedModel._meta.get_fields()] == [
+        "id",
+        "name_en",
+        "name_de",
+        "is_active",
+        "is_featured",
+    ]
+
+    obj = PackedModel()
+    assert (obj.is_active_en, obj.is_active_de) == (True, True)
+    assert (obj.is_featured_en, obj.is_featured_de) == (False, False)
+    with override("de"):
+        obj.is_active = False
+        obj.is_featured = True
+        assert not obj.is_active
+    with override("en"):
+        assert obj.is_active
+        assert not obj.is_featured
+    assert (obj.is_active_bits, obj.is_featured_bits) == (0b01, 0b10)
+    obj.save()
+    PackedModel.objects.create(is_active_bits=0b11, is_featured_bits=0)
+    PackedModel.objects.create(is_active_bits=0, is_featured_bits=0)
+
+    def bits(**kwargs):
+        return sorted(
+            PackedModel.objects.filter(**kwargs).values_list(
+                "is_active_bits", flat=True
+            )
+        )
+
+    assert bits(is_active__in_language="en") == [0b01, 0b11]
+    assert bits(is_active__in_language="de") == [0b11]
+    assert bits(is_active__any_language=True) == [0b01, 0b11]
+    assert bits(is_active__any_language=False) == [0]
+    assert bits(is_active__all_languages=True) == [0b11]
+    assert bits(is_active__all_languages=False) == [0, 0b01]
+    with pytest.raises(ValueError):
+        bits(is_active__in_language="fr")
+
+    form_class = modelform_factory(PackedModel, fields="__all__")
+    form = form_class(instance=obj)
+    html = str(form["is_active"])
+    assert 'type="checkbox" name="is_active" value="en"' in html
+    assert 'value="en" id="id_is_active_0" checked' in html
+    assert 'value="de" id="id_is_active_1" checked' not in html
+    form = form_class(
+        {"name_en": "x", "name_de": "", "is_active": ["de"]}, instance=obj
+    )
+    assert form.is_valid(), form.errors
+    assert form.changed_data == ["name_en", "is_active", "is_featured"]
+    form.save()
+    obj.refresh_from_db()
+    assert (obj.is_active_bits, obj.is_featured_bits) == (0b10, 0)
+
+
+@isolate_apps("testapp")
+def test_packed_booleans_pinned_bits():
+    class PinnedModel(models.Model):
+        # "fr" has been removed, its bit stays reserved
+        is_active = TranslatedField(
+            models.BooleanField(default=True), packed={"de": 0, "fr": 1, "en": 2}
+        )
+
+        def __str__(self):
+            return str(self.pk)
+
+    field = PinnedModel._meta.get_field("is_active")
+    assert field.deconstruct()[3]["bits"] == {"de": 0, "fr": 1, "en": 2}
+    assert field.default == field.full_mask == 0b101
+    assert "bits" not in PackedModel._meta.get_field("is_active").deconstruct()[3]
+
+    obj = PinnedModel(is_active_bits=0b100)
+    assert (obj.is_active_en, obj.is_active_de) == (True, False)
+    obj.is_active_de = True
+    assert obj.is_active_bits == 0b101
+
+    formfield = field.formfield()
+    assert formfield.prepare_value(0b100) == ["en"]
+    assert formfield.clean(["de"]) == 0b001
+
+    with pytest.raises(ImproperlyConfigured):
+
+        class MissingModel(models.Model):
+            is_active = TranslatedField(models.BooleanField(), packed={"en": 0})
+
+            def __str__(self):
+                return str(self.pk)
+
+
+@isolate_apps("testapp")
+def test_cached_attrgetter():
+    calls = []
+
+    def counting(name, field):
+        def getter(self):
+            calls.append(name)
+            return f"<p>{getattr(self, to_attribute(name))}{self.suffix}</p>"
+
+        return getter
+
+    class CachedModel(models.Model):
+        name = TranslatedField(
+            models.CharField(max_length=200),
+            attrgetter=cached_attrgetter(counting, depends_on=["suffix"], maxsize=1),
+        )
+        suffix = ""
+
+        def __str__(self):
+            return self.name
+
+    obj = CachedModel(name_en="Hello", name_de="Hallo")
+    with override("en"):
+        assert obj.name == obj.name == "<p>Hello</p>"
+        assert len(calls) == 1
+
+        obj.name = "Hi"
+        assert obj.name == "<p>Hi</p>"
+        obj.name_de = "Servus"
+        assert obj.name == "<p>Hi</p>"
+        obj.suffix = "!"
+        assert obj.name == "<p>Hi!</p>"
+        assert len(calls) == 4
+
+    with override("de"):
+        assert obj.name == obj.name == "<p>Servus!</p>"
+        assert len(calls) == 5
+    with override("en"):
+        # Evicted (maxsize=1)
+        assert obj.name == "<p>Hi!</p>"
+        assert len(calls) == 6
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from testapp.models import SourceTrackedModel, TestModel
+from translated_fields.fields import source_hash
+from translated_fields.pretranslate import (
+    StubBackend,
+    _translate_batches,
+    apretranslate,
+    pretranslate,
+)
+
+
+class FlakyBackend(StubBackend):
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+
+    async def translate(self, texts, *, source, target):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Try again")
+        return await super().translate(texts, source=source, target=target)
+
+
+@pytest.mark.django_db
+def test_pretranslate():
+    TestModel.objects.create(name_en="Hello")
+    TestModel.objects.create(name_en="Hello", other_en="World")
+    TestModel.objects.create(name_en="Bye", name_de="Tschüss")
+    TestModel.objects.create(name_en="")
+
+    backend = StubBackend()
+    assert (
+        pretranslate(TestModel.objects.all(), ["name", "other"], backend, chunk_size=2)
+        == 2
+    )
+    # Texts are deduplicated
+    assert backend.requests == [("en", "de", ["Hello", "World"])]
+    assert list(
+        TestModel.objects.order_by("pk").values_list("name_de", "other_de")
+    ) == [
+        ("[de] Hello", ""),
+        ("[de] Hello", "[de] World"),
+        ("Tschüss", ""),
+        ("", ""),
+    ]
+
+    # Nothing left to do
+    backend = StubBackend()
+    assert pretranslate(TestModel.objects.all(), ["name", "other"], backend) == 0
+    assert backend.requests == []
+
+
+@pytest.mark.django_db
+def test_pretranslate_batches_and_retries():
+    TestModel.objects.bulk_create(TestModel(name_en=f"Text {i}") for i in range(5))
+
+    backend = FlakyBackend(failures=2)
+    assert (
+        pretranslate(
+            TestModel.objects.all(),
+            ["name"],
+            backend,
+            batch_size=2,
+            concurrency=2,
+            rate=1000,
+            retry_delay=0,
+        )
+        == 5
+    )
+    assert [len(texts) for _s, _t, texts in backend.requests] == [2, 2, 1]
+
+    TestModel.objects.update(name_de="")
+    with pytest.raises(ConnectionError):
+        pretranslate(
+            TestModel.objects.all(),
+            ["name"],
+            FlakyBackend(failures=2),
+            retries=1,
+            retry_delay=0,
+        )
+    assert set(TestModel.objects.values_list("name_de", flat=True)) == {""}
+
+
+def test_failing_batch_cancels_siblings():
+    class SlowBackend(StubBackend):
+        cancelled = 0
+
+        async def translate(self, texts, *, source, target):
+            if texts == ["fail"]:
+                raise ConnectionError("Gone")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            return await super().translate(texts, source=source, target=target)
+
+    backend = SlowBackend()
+    batches = [("en", "de", ["a"]), ("en", "de", ["fail"]), ("en", "de", ["b"])]
+
+    async def run():
+        with pytest.raises(ConnectionError):
+            await _translate_batches(
+                backend,
+                batches,
+                concurrency=3,
+                rate=None,
+                retries=0,
+                retry_delay=0,
+            )
+        # No sibling batch is left running
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(run()) == set()
+    assert backend.cancelled == 2
+    assert backend.requests == []
+
+
+@pytest.mark.django_db
+def test_pretranslate_source_tracking():
+    obj = SourceTrackedModel.objects.create(name_en="a", name_de="a-de")
+    obj.name_en = "b"
+    obj.save()
+    SourceTrackedModel.objects.update(name_de="")
+    assert SourceTrackedModel.objects.stale_translations("de").exists()
+
+    assert pretranslate(SourceTrackedModel.objects.all(), ["name"], StubBackend()) == 1
+    obj.refresh_from_db()
+    assert obj.name_de == "[de] b"
+    assert obj.name_de_source == source_hash("b")
+    assert not SourceTrackedModel.objects.stale_translations("de").exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_apretranslate():
+    TestModel.objects.create(name_en="Hello")
+    TestModel.objects.create(name_en="Bye")
+
+    async def run():
+        # Called from a running event loop
+        return await apretranslate(
+            TestModel.objects.all(), ["name"], StubBackend(), chunk_size=1
+        )
+
+    assert asyncio.run(run()) == 2
+    assert set(TestModel.objects.values_list("name_de", flat=True)) == {
+        "[de] Hello",
+        "[de] Bye",
+    }
@@ -0,0 +1,101 @@
+from io import StringIO
+
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.state import ProjectState
+
+from testapp.models import AliasModel, ListDisplayModel, TestModel
+from translated_fields.reporting import (
+    CreateTranslatedViews,
+    create_views,
+    drop_views,
+    view_languages,
+    view_sql,
+)
+
+
+def _rows(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        return cursor.fetchall()
+
+
+def test_view_sql():
+    assert view_sql(TestModel, "de", connection) == (
+        'SELECT "id",'
+        ' COALESCE(NULLIF("name_de", \'\'), "name_en") AS "name",'
+        ' COALESCE(NULLIF("other_de", \'\'), "other_en") AS "other"'
+        ' FROM "testapp_testmodel"'
+    )
+    assert view_sql(TestModel, "en", connection) == (
+        'SELECT "id", "name_en" AS "name", "other_en" AS "other"'
+        ' FROM "testapp_testmodel"'
+    )
+    assert '"is_active_de", "is_active_en"' in view_sql(
+        ListDisplayModel, "de", connection
+    )
+    assert view_languages(AliasModel) == ["en", "de", "de-ch", "en-gb", "de-at"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_views():
+    TestModel.objects.create(name_en="Hello", name_de="Hallo", other_en="World")
+    assert create_views(TestModel) == ["testapp_testmodel_en", "testapp_testmodel_de"]
+    try:
+        assert _rows('SELECT "name", "other" FROM "testapp_testmodel_de"') == [
+            ("Hallo", "World")
+        ]
+
+        # Views of languages which have been removed are dropped, other views
+        # are left alone
+        _rows('CREATE VIEW "testapp_testmodel_fr" AS SELECT 1')
+        _rows('CREATE VIEW "testapp_testmodel_top_names" AS SELECT 1')
+        out = StringIO()
+        call_command("translated_views", "testapp.TestModel", stdout=out)
+        assert out.getvalue() == (
+            "testapp.TestModel: testapp_testmodel_en, testapp_testmodel_de\n"
+        )
+        views = [
+            info.name
+            for info in connection.introspection.get_table_list(connection.cursor())
+            if info.type == "v"
+        ]
+        assert sorted(views) == [
+            "testapp_testmodel_de",
+            "testapp_testmodel_en",
+            "testapp_testmodel_top_names",
+        ]
+    finally:
+        drop_views(TestModel)
+        _rows('DROP VIEW IF EXISTS "testapp_testmodel_top_names"')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_operation():
+    operation = CreateTranslatedViews("TestModel", languages=["de"])
+    assert operation.deconstruct() == (
+        "CreateTranslatedViews",
+        [],
+        {"model_name": "TestModel", "languages": ["de"]},
+    )
+    # Replaying migrations before other_de has been added
+    state = ProjectState.from_apps(apps)
+    del state.models["testapp", "testmodel"].fields["other_de"]
+    with connection.schema_editor() as editor:
+        operation.database_forwards("testapp", editor, state, state)
+    assert _rows('SELECT COUNT(*) FROM "testapp_testmodel_de"') == [(0,)]
+    sql = (
+        'CREATE VIEW "testapp_testmodel_de" AS SELECT "id",'
+        ' COALESCE(NULLIF("name_de", \'\'), "name_en") AS "name",'
+        ' "other_en" AS "other" FROM "testapp_testmodel"'
+    )
+    assert _rows(
+        "SELECT sql FROM sqlite_master WHERE name = 'testapp_testmodel_de'"
+    ) == [(sql,)]
+    with connection.schema_editor() as editor:
+        operation.database_backwards("testapp", editor, state, state)
+    assert "testapp_testmodel_de" not in connection.introspection.table_names(
+        include_views=True
+    )
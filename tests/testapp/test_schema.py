@@ -0,0 +1,75 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from testapp.models import TestModel
+from translated_fields import checks
+
+
+def test_schema_footprint():
+    assert checks.schema_footprint(TestModel) == {
+        "columns": 5,
+        "row_bytes": 8 + 4 * 802,
+        "translated_columns": 4,
+        "translated_row_bytes": 4 * 802,
+    }
+
+
+def test_check_translated_schema(monkeypatch):
+    assert checks.check_translated_schema() == []
+
+    monkeypatch.setitem(
+        checks.SCHEMA_LIMITS, "sqlite", {"columns": 5, "row_bytes": 4000}
+    )
+    messages = [
+        message
+        for message in checks.check_translated_schema()
+        if message.obj is TestModel
+    ]
+    assert [message.id for message in messages] == [
+        "translated_fields.W001",
+        "translated_fields.W002",
+    ]
+
+    monkeypatch.setitem(
+        checks.SCHEMA_LIMITS, "sqlite", {"columns": 4, "row_bytes": 3000}
+    )
+    messages = [
+        message
+        for message in checks.check_translated_schema(databases=["default"])
+        if message.obj is TestModel
+    ]
+    assert [message.id for message in messages] == [
+        "translated_fields.E001",
+        "translated_fields.E002",
+    ]
+    assert messages[0].msg == (
+        "The table of 'testapp.TestModel' has 5 columns (4 from translated fields),"
+        " sqlite allows at most 4."
+    )
+
+
+@pytest.mark.django_db
+def test_translated_schema_report():
+    TestModel.objects.create(name_en="Hello", name_de="Hallo")
+    TestModel.objects.create(name_en="World")
+
+    stdout = StringIO()
+    call_command("translated_schema_report", "testapp.TestModel", stdout=stdout)
+    output = stdout.getvalue()
+    assert "testapp.TestModel (testapp_testmodel)" in output
+    assert "columns: 5 (4 translated)" in output
+    assert "name_en: 802 bytes, max. length 5, avg. length 5.0, 0/2 empty" in output
+    assert "name_de: 802 bytes, max. length 5, avg. length 2.5, 1/2 empty" in output
+    assert (
+        "suggestion: reduce the size of columns using"
+        " specific={'en': {'max_length': 10}, 'de': {'max_length': 10}}"
+    ) in output
+    assert "the columns of en, de are mostly empty" in output
+
+    stdout = StringIO()
+    call_command("translated_schema_report", "testapp", "--no-data", stdout=stdout)
+    output = stdout.getvalue()
+    assert "testapp.ListDisplayModel" in output
+    assert "suggestion" not in output
@@ -0,0 +1,148 @@
+import io
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection, models
+from django.utils.translation import override
+
+from testapp.models import SearchModel
+from translated_fields import TranslatedField
+from translated_fields.pretranslate import StubBackend, pretranslate
+from translated_fields.search import _post_migrate, search, search_backend
+
+
+def test_only_text_fields():
+    with pytest.raises(ImproperlyConfigured):
+        TranslatedField(models.IntegerField(), searchable=True)
+
+
+@pytest.mark.django_db
+def test_search_translated():
+    apple = SearchModel.objects.create(
+        name_en="Apple pie",
+        name_de="Apfelkuchen",
+        description_en="Apple, apple and more apple",
+    )
+    pear = SearchModel.objects.create(
+        name_en="Pear", description_en="Not an apple but a pear"
+    )
+    SearchModel.objects.create(name_en="Plum", name_de="Pflaume")
+
+    qs = SearchModel.objects.all()
+    assert qs.search_translated("name", "apple", language="en") == [apple.pk]
+    assert qs.search_translated("description", "apple", language="en") == [
+        apple.pk,
+        pear.pk,
+    ]
+    assert qs.search_translated("name", "apfelkuchen", language="de") == [apple.pk]
+    # Empty translations fall back to the primary language
+    assert qs.search_translated("name", "pear", language="de") == [pear.pk]
+    with override("de"):
+        assert qs.search_translated("name", "pflaume") == [pear.pk + 1]
+    assert qs.with_language("en").search_translated("name", "pflaume") == []
+    # Query syntax isn't interpreted
+    assert qs.search_translated("name", 'pie" OR "pear', language="en") == []
+    assert qs.search_translated("name", "   ", language="en") == []
+
+    assert qs.exclude(pk=apple.pk).search_translated(
+        "description", "apple", language="en"
+    ) == [pear.pk]
+    with pytest.raises(ValueError):
+        search(SearchModel, "unknown", "apple", language="en")
+
+
+@pytest.mark.django_db
+def test_search_sync():
+    obj = SearchModel.objects.create(name_en="Apple")
+    obj.name_en = "Banana"
+    obj.save()
+    assert SearchModel.objects.search_translated("name", "apple", language="en") == []
+    assert SearchModel.objects.search_translated("name", "banana", language="en") == [
+        obj.pk
+    ]
+
+    SearchModel.objects.filter(pk=obj.pk).update(name_en="Cherry")
+    assert SearchModel.objects.search_translated("name", "cherry", language="en") == [
+        obj.pk
+    ]
+
+    obj.name_en = "Date"
+    SearchModel.objects.bulk_update([obj], ["name_en"])
+    assert SearchModel.objects.search_translated("name", "date", language="en") == [
+        obj.pk
+    ]
+
+    SearchModel.objects.bulk_create(
+        [SearchModel(name_en="Elderberry"), SearchModel(name_en="Fig")]
+    )
+    elderberry = SearchModel.objects.get(name_en="Elderberry")
+    assert SearchModel.objects.search_translated(
+        "name", "elderberry", language="en"
+    ) == [elderberry.pk]
+
+    # Conflicting rows aren't written
+    SearchModel.objects.bulk_create(
+        [SearchModel(pk=elderberry.pk, name_en="Grape"), SearchModel(name_en="Kiwi")],
+        ignore_conflicts=True,
+    )
+    assert SearchModel.objects.search_translated("name", "grape", language="en") == []
+    assert SearchModel.objects.search_translated("name", "kiwi", language="en") == [
+        SearchModel.objects.get(name_en="Kiwi").pk
+    ]
+
+    obj.delete()
+    assert SearchModel.objects.search_translated("name", "date", language="en") == []
+
+
+@pytest.mark.django_db
+def test_rebuild_search_index():
+    obj = SearchModel.objects.create(name_en="Grape")
+    SearchModel.objects.bulk_create(SearchModel(name_en="Grape") for _ in range(4))
+    # Bypass the index
+    models.QuerySet(SearchModel).filter(pk=obj.pk).update(name_en="Honeydew")
+    assert (
+        SearchModel.objects.search_translated("name", "honeydew", language="en") == []
+    )
+
+    stdout = io.StringIO()
+    call_command("rebuild_search_index", "testapp", chunk_size=2, stdout=stdout)
+    assert stdout.getvalue() == "testapp.SearchModel: 5 rows indexed\n"
+    assert SearchModel.objects.search_translated("name", "honeydew", language="en") == [
+        obj.pk
+    ]
+    assert (
+        len(SearchModel.objects.search_translated("name", "grape", language="en")) == 4
+    )
+
+
+@pytest.mark.django_db
+def test_search_sync_pretranslate():
+    obj = SearchModel.objects.create(name_en="Apple")
+    assert SearchModel.objects.search_translated("name", "de", language="de") == []
+
+    # Uses bulk_update() of the base manager
+    pretranslate(SearchModel.objects.all(), ["name"], StubBackend())
+    assert SearchModel.objects.search_translated("name", "de", language="de") == [
+        obj.pk
+    ]
+
+
+@pytest.mark.django_db
+def test_search_index_columns_changed():
+    obj = SearchModel.objects.create(name_en="Apple", description_en="Pie")
+    backend = search_backend(connection)
+    assert backend.is_current(SearchModel, ["en", "de"])
+
+    # Index created before adding the description field
+    backend.drop(SearchModel, ["en"])
+    backend._execute(
+        f"CREATE VIRTUAL TABLE {backend._table(SearchModel, 'en')} USING fts5(name)"
+    )
+    assert not backend.is_current(SearchModel, ["en", "de"])
+
+    _post_migrate(SearchModel._meta.app_config, using=connection.alias)
+    assert backend.is_current(SearchModel, ["en", "de"])
+    assert SearchModel.objects.search_translated(
+        "description", "pie", language="en"
+    ) == [obj.pk]
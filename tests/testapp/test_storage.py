@@ -0,0 +1,105 @@
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from testapp.models import DocumentModel
+from translated_fields.storage import ContentAddressedStorage
+
+
+@pytest.fixture
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+def test_deconstruct():
+    storage = ContentAddressedStorage(prefix="files")
+    assert storage.deconstruct() == (
+        "translated_fields.storage.ContentAddressedStorage",
+        (),
+        {"prefix": "files"},
+    )
+
+
+@pytest.mark.django_db
+def test_deduplication(media, django_capture_on_commit_callbacks):
+    storage = DocumentModel.file_en.field.storage
+    assert DocumentModel.file_de.field.storage is storage
+
+    obj = DocumentModel()
+    obj.file_en.save("Report.PDF", ContentFile(b"same"), save=False)
+    obj.file_de.save("bericht.pdf", ContentFile(b"same"), save=False)
+    obj.save()
+    assert obj.file_en.name == obj.file_de.name
+    assert obj.file_en.name.startswith("cas/")
+    assert obj.file_en.name.endswith(".pdf")
+    assert obj.file_en.read() == b"same"
+
+    other = DocumentModel()
+    other.file_en.save("other.pdf", ContentFile(b"same"), save=True)
+    other.file_de.save("other.pdf", ContentFile(b"different"), save=True)
+    assert other.file_en.name == obj.file_en.name
+    assert other.file_de.name != obj.file_de.name
+    assert len(list(media.glob("cas/*/*"))) == 2
+
+    # Still referenced by obj
+    with django_capture_on_commit_callbacks(execute=True):
+        other.delete()
+    assert default_storage.exists(obj.file_en.name)
+    assert not default_storage.exists(other.file_de.name)
+
+    # FieldFile.delete() leaves the file to cleanup()
+    name = obj.file_en.name
+    obj.file_en.delete()
+    assert default_storage.exists(name)
+    assert storage.cleanup() == []
+    obj.file_de.delete()
+    assert storage.cleanup() == [name]
+    assert not default_storage.exists(name)
+
+
+@pytest.mark.django_db
+def test_shared_files(media, django_capture_on_commit_callbacks):
+    obj = DocumentModel()
+    obj.file_en.save("a.pdf", ContentFile(b"a"), save=True)
+    name = obj.file_en.name
+
+    # Other instances using the same prefix share the files
+    storage = ContentAddressedStorage()
+    assert storage.shares_files(DocumentModel.file_en.field.storage)
+    assert storage.is_referenced(name)
+    storage.delete(name)
+    assert default_storage.exists(name)
+    assert not ContentAddressedStorage(prefix="other").is_referenced(name)
+
+    # Files are only deleted when the deletion is committed
+    with django_capture_on_commit_callbacks() as callbacks:
+        DocumentModel.objects.all().delete()
+    assert default_storage.exists(name)
+    for callback in callbacks:
+        callback()
+    assert not default_storage.exists(name)
+
+
+@pytest.mark.django_db
+def test_batched_reference_checks(media, django_capture_on_commit_callbacks):
+    names = []
+    for i in range(3):
+        obj = DocumentModel()
+        obj.file_en.save("a.pdf", ContentFile(f"{i}".encode()), save=False)
+        obj.file_de.save("a.pdf", ContentFile(b"shared"), save=True)
+        names.extend([obj.file_en.name, obj.file_de.name])
+    kept = DocumentModel()
+    kept.file_en.save("b.pdf", ContentFile(b"shared"), save=True)
+
+    callbacks = django_capture_on_commit_callbacks(execute=True)
+    with CaptureQueriesContext(connection) as queries, callbacks:
+        DocumentModel.objects.exclude(pk=kept.pk).delete()
+    # One reference check for all deleted rows
+    assert len([q for q in queries if '"file_en" IN' in q["sql"]]) == 1
+    assert default_storage.exists(kept.file_en.name)
+    assert [name for name in names if default_storage.exists(name)] == [
+        kept.file_en.name
+    ] * 3
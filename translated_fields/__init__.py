@@ -6,4 +6,7 @@ from importlib.util import find_spec
 if find_spec("django"):
     from translated_fields.admin import *  # noqa: F403
     from translated_fields.fields import *  # noqa: F403
+    from translated_fields.forms import *  # noqa: F403
+    from translated_fields.query import *  # noqa: F403
+    from translated_fields.tracking import *  # noqa: F403
     from translated_fields.utils import *  # noqa: F403
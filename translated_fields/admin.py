@@ -1,22 +1,442 @@
+from functools import cache, partial
+
 from django.contrib.admin.options import BaseModelAdmin
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.core.paginator import Paginator
+from django.db import router
+from django.forms import modelformset_factory
+from django.http import Http404, HttpResponseRedirect
+from django.template.response import TemplateResponse
+from django.urls import path
+from django.utils.translation import gettext as _, ngettext
 
-from translated_fields.fields import show_language_code
+from translated_fields.fields import (
+    TranslatedField,
+    _auxiliary_fields_for,
+    _translated_fields,
+    show_language_code,
+    to_attribute,
+    translated_attrgetter,
+)
+from translated_fields.forms import TranslatedModelForm
+from translated_fields.query import _language_attributes
+from translated_fields.search import _sync_index
+from translated_fields.utils import fallback_to_default
 
 
 __all__ = ("TranslatedFieldAdmin",)
 
 
+ALL_LANGUAGES_VAR = "_all_languages"
+LANGUAGES_VAR = "_languages"
+LANGUAGES_SESSION_KEY = "translated_fields_languages"
+
+
+def _expand_search_field(model, search_field, languages, *, all_languages=False):
+    prefix = search_field[0] if search_field.startswith(("^", "=", "@")) else ""
+    name, sep, lookup = search_field.removeprefix(prefix).partition("__")
+    field = getattr(model, name, None)
+    if not isinstance(field, TranslatedField):
+        return [search_field]
+
+    if all_languages:
+        languages = field.languages
+    elif languages is None:
+        return [f"{prefix}{field.resolved_attribute()}{sep}{lookup}"]
+    return [
+        f"{prefix}{to_attribute(name, language)}{sep}{lookup}"
+        for language in languages
+        if language in field.languages
+    ]
+
+
+def _translated_order_field(model, order_field):
+    if not isinstance(order_field, str):
+        return order_field
+    prefix = "-" if order_field.startswith("-") else ""
+    field = getattr(model, order_field.removeprefix(prefix), None)
+    if isinstance(field, TranslatedField):
+        return f"{prefix}{field.admin_order_field}"
+    return order_field
+
+
+class TranslatedFieldAdminChecksMixin:
+    """Accept translated field names in ``ordering``"""
+
+    def _check_ordering_item(self, obj, field_name, label):
+        return super()._check_ordering_item(
+            obj, _translated_order_field(obj.model, field_name), label
+        )
+
+
+@cache
+def _translated_checks_class(checks_class):
+    # The checks class of model admins and inlines differ
+    return type(
+        f"Translated{checks_class.__name__}",
+        (TranslatedFieldAdminChecksMixin, checks_class),
+        {},
+    )
+
+
+def _without_fields(fields, excluded):
+    result = []
+    for field in fields:
+        if isinstance(field, (list, tuple)):
+            if row := tuple(f for f in field if f not in excluded):
+                result.append(row)
+        elif field not in excluded:
+            result.append(field)
+    return result
+
+
+def _form_cache_key(request, obj, languages, model_admin, kwargs):
+    key = (
+        getattr(getattr(request, "user", None), "pk", None),
+        tuple(languages),
+        tuple(model_admin.get_readonly_fields(request, obj)),
+        model_admin.has_change_permission(request, obj),
+        *(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in sorted(kwargs.items())
+        ),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _list_display_fields(model, model_admin, name):
+    """
+    Return the fields required to show ``name`` in the changelist or ``None``
+    if it isn't known which fields are required.
+    """
+    if callable(name) or hasattr(model_admin, name):
+        return None
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        pass
+    else:
+        return [field.name] if field.concrete and not field.many_to_many else None
+
+    field = getattr(model, name, None)
+    if not isinstance(field, TranslatedField):
+        return None
+    if field._attrgetter in {translated_attrgetter, fallback_to_default}:
+        return _language_attributes(name, field)
+    return field.fields
+
+
+class _LanguageCodeTemplateResponse(TemplateResponse):
+    """
+    Template response rendering the labels of translated fields with their
+    language code whenever it is rendered
+    """
+
+    @property
+    def rendered_content(self):
+        with show_language_code(True):  # noqa: FBT003
+            return super().rendered_content
+
+
+def _show_language_codes(response):
+    if type(response) is TemplateResponse:
+        # Leave rendering to the handler (and to middleware which may still
+        # modify the context)
+        response.__class__ = _LanguageCodeTemplateResponse
+    elif hasattr(response, "render"):
+        # Unknown response classes have to be rendered now
+        response.render()
+    return response
+
+
+class TranslatedChangeList(ChangeList):
+    def get_filters_params(self, *args, **kwargs):
+        lookup_params = super().get_filters_params(*args, **kwargs)
+        lookup_params.pop(ALL_LANGUAGES_VAR, None)
+        return lookup_params
+
+    def get_results(self, request):
+        fields = self.get_list_display_fields()
+        if fields is not None:
+            select_related = self.queryset.query.select_related
+            # Relations named in select_related() cannot be deferred, the
+            # related models are loaded completely
+            self.queryset = self.queryset.only(
+                *fields, *(select_related if isinstance(select_related, dict) else ())
+            )
+        super().get_results(request)
+
+    def get_list_display_fields(self):
+        """
+        Return the list of fields required to display the changelist rows,
+        ``None`` means that all fields have to be loaded
+        """
+        fields = []
+        for name in self.list_display:
+            if name == "action_checkbox":
+                continue
+            if (
+                name_fields := _list_display_fields(self.model, self.model_admin, name)
+            ) is None:
+                return None
+            fields.extend(name_fields)
+        return list(dict.fromkeys(fields))
+
+
 class TranslatedFieldAdmin(BaseModelAdmin):
+    # Languages searched when search_fields contains translated field names.
+    # None only searches the active language. Add ?_all_languages=1 to the
+    # changelist URL to search all languages instead.
+    translated_search_languages = None
+
+    # Number of objects per page in the translation grid
+    translation_grid_per_page = 50
+
+    def check(self, **kwargs):
+        return _translated_checks_class(self.checks_class)().check(self, **kwargs)
+
+    def get_ordering(self, request):
+        return [
+            _translated_order_field(self.model, order_field)
+            for order_field in super().get_ordering(request)
+        ]
+
+    def get_changelist(self, request, **kwargs):
+        return TranslatedChangeList
+
+    def get_translated_languages(self, request):
+        """
+        Return the languages whose fields are shown in the change form or
+        ``None`` for all languages
+
+        The selection is read from the ``_languages`` query parameter (a comma
+        separated list of language codes, empty to show all languages) and
+        remembered in the session.
+        """
+        session = getattr(request, "session", None)
+        if LANGUAGES_VAR in request.GET:
+            languages = [
+                language
+                for language in request.GET[LANGUAGES_VAR].split(",")
+                if language
+            ]
+            if session is not None:
+                session[LANGUAGES_SESSION_KEY] = languages
+        else:
+            languages = session.get(LANGUAGES_SESSION_KEY) if session else None
+        return languages or None
+
+    def _excluded_language_fields(self, request, obj):
+        # Adding objects always requires all languages' fields.
+        languages = None if obj is None else self.get_translated_languages(request)
+        if languages is None:
+            return set()
+        return {
+            field.name
+            for field in self.model._meta.get_fields()
+            if hasattr(field, "_translated_field_language_code")
+            and field._translated_field_language_code not in languages
+        }
+
+    def get_fieldsets(self, request, obj=None):
+        fieldsets = super().get_fieldsets(request, obj)
+        if excluded := self._excluded_language_fields(request, obj):
+            return [
+                (
+                    name,
+                    {**options, "fields": _without_fields(options["fields"], excluded)},
+                )
+                for name, options in fieldsets
+            ]
+        return fieldsets
+
+    def get_form(self, request, obj=None, **kwargs):
+        if not self._excluded_language_fields(request, obj):
+            return super().get_form(request, obj, **kwargs)
+
+        languages = self.get_translated_languages(request)
+        key = _form_cache_key(request, obj, languages, self, kwargs)
+        cache = self.__dict__.setdefault("_translated_form_cache", {})
+        if key is None or key not in cache:
+            form = super().get_form(request, obj, **kwargs)
+            if key is None:
+                return form
+            if len(cache) >= 128:
+                cache.clear()
+            cache[key] = form
+        return cache[key]
+
+    def save_model(self, request, obj, form, change):
+        if change and (excluded := self._excluded_language_fields(request, obj)):
+            # Leave only the columns of languages which aren't shown alone,
+            # values set elsewhere (auto_now, clean(), save_model()) are saved
+            update_fields = [
+                field.name
+                for field in self.model._meta.concrete_fields
+                if not field.primary_key
+                and not getattr(field, "generated", False)
+                and field.name not in excluded
+            ]
+            obj.save(
+                update_fields=list(
+                    dict.fromkeys(
+                        [
+                            *update_fields,
+                            *_auxiliary_fields_for(self.model, update_fields),
+                        ]
+                    )
+                )
+            )
+        else:
+            super().save_model(request, obj, form, change)
+
+    def get_urls(self):
+        opts = self.model._meta
+        return [
+            path(
+                "translate/",
+                self.admin_site.admin_view(self.translation_grid_view),
+                name=f"{opts.app_label}_{opts.model_name}_translate",
+            ),
+            *super().get_urls(),
+        ]
+
+    def translation_grid_view(self, request):
+        """
+        Edit one target language of all translated fields for a page of
+        objects at once, showing the source language's values alongside
+        """
+        if not self.has_change_permission(request):
+            raise PermissionDenied
+
+        fields = _translated_fields(self.model)
+        languages = list(
+            dict.fromkeys(
+                language for field in fields.values() for language in field.languages
+            )
+        )
+        source = request.GET.get("source") or languages[0]
+        target = request.GET.get("target") or languages[min(1, len(languages) - 1)]
+        if source not in languages or target not in languages:
+            raise Http404(_("Unknown language."))
+        readonly = set(self.get_readonly_fields(request))
+        names = [
+            name
+            for name, field in fields.items()
+            if source in field.languages
+            and target in field.languages
+            and name not in readonly
+            and to_attribute(name, target) not in readonly
+        ]
+        source_fields = [to_attribute(name, source) for name in names]
+        target_fields = [to_attribute(name, target) for name in names]
+        # Computed columns and the columns they are computed from
+        auxiliary_fields = _auxiliary_fields_for(self.model, target_fields)
+        primary_fields = [
+            fields[name].fields[0] for name in names if fields[name]._auxiliary_fields()
+        ]
+
+        paginator = Paginator(
+            self.get_queryset(request)
+            .order_by("pk")
+            .only(*source_fields, *target_fields, *primary_fields, *auxiliary_fields),
+            self.translation_grid_per_page,
+        )
+        page = paginator.get_page(request.GET.get("p"))
+        formset_class = modelformset_factory(
+            self.model,
+            form=TranslatedModelForm,
+            fields=target_fields,
+            extra=0,
+            formfield_callback=partial(self.formfield_for_dbfield, request=request),
+        )
+        formset = formset_class(
+            request.POST if request.method == "POST" else None,
+            queryset=page.object_list,
+        )
+
+        if request.method == "POST" and formset.is_valid():
+            changed = [
+                form.instance
+                for form in formset.initial_forms
+                if form.instance.pk and form.has_changed()
+            ]
+            if changed:
+                # bulk_update() doesn't send pre_save
+                for instance in changed:
+                    for name in names:
+                        fields[name]._update_auxiliary_fields(instance)
+                self.model._base_manager.bulk_update(
+                    changed, [*target_fields, *auxiliary_fields]
+                )
+                _sync_index(
+                    self.model,
+                    [instance.pk for instance in changed],
+                    target_fields,
+                    using=router.db_for_write(self.model),
+                )
+            self.message_user(
+                request,
+                ngettext(
+                    "%(count)s object has been updated.",
+                    "%(count)s objects have been updated.",
+                    len(changed),
+                )
+                % {"count": len(changed)},
+            )
+            return HttpResponseRedirect(request.get_full_path())
+
+        opts = self.model._meta
+        context = {
+            **self.admin_site.each_context(request),
+            "title": _("Translate %(name)s") % {"name": opts.verbose_name_plural},
+            "opts": opts,
+            "languages": languages,
+            "source": source,
+            "target": target,
+            "page": page,
+            "formset": formset,
+            "columns": [fields[name].short_description for name in names],
+            "rows": [
+                (
+                    form,
+                    [
+                        (getattr(form.instance, source_field), form[target_field])
+                        for source_field, target_field in zip(
+                            source_fields, target_fields
+                        )
+                    ],
+                )
+                for form in formset.forms
+            ],
+        }
+        request.current_app = self.admin_site.name
+        return TemplateResponse(
+            request, "admin/translated_fields/translation_grid.html", context
+        )
+
+    def get_search_fields(self, request):
+        all_languages = bool(request.GET.get(ALL_LANGUAGES_VAR))
+        return [
+            expanded
+            for search_field in super().get_search_fields(request)
+            for expanded in _expand_search_field(
+                self.model,
+                search_field,
+                self.translated_search_languages,
+                all_languages=all_languages,
+            )
+        ]
+
     def changelist_view(self, *args, **kwargs):
         with show_language_code(True):  # noqa: FBT003
-            response = super().changelist_view(*args, **kwargs)
-            if hasattr(response, "render"):
-                response.render()
-            return response
+            return _show_language_codes(super().changelist_view(*args, **kwargs))
 
     def changeform_view(self, *args, **kwargs):
         with show_language_code(True):  # noqa: FBT003
-            response = super().changeform_view(*args, **kwargs)
-            if hasattr(response, "render"):
-                response.render()
-            return response
+            return _show_language_codes(super().changeform_view(*args, **kwargs))
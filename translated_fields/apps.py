@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class TranslatedFieldsConfig(AppConfig):
+    name = "translated_fields"
+
+    def ready(self):
+        from translated_fields import (  # noqa: PLC0415
+            checks,  # noqa: F401
+            search,
+            storage,
+        )
+
+        search._connect_signals()
+        storage._connect_signals()
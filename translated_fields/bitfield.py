@@ -0,0 +1,182 @@
+from django import forms
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.db.models import Lookup
+
+
+__all__ = ["LanguageBitField"]
+
+
+class LanguageBitsFormField(forms.MultipleChoiceField):
+    """
+    Form field editing the languages of a ``LanguageBitField`` using one
+    checkbox per language
+    """
+
+    widget = forms.CheckboxSelectMultiple
+
+    def __init__(self, *, languages, bits, **kwargs):
+        self.languages = list(languages)
+        self.bits = bits
+        names = dict(settings.LANGUAGES)
+        kwargs.setdefault(
+            "choices",
+            [(language, names.get(language, language)) for language in languages],
+        )
+        kwargs["required"] = False
+        super().__init__(**kwargs)
+
+    def prepare_value(self, value):
+        if isinstance(value, int):
+            return [
+                language
+                for language in self.languages
+                if value & 1 << self.bits[language]
+            ]
+        return value
+
+    def clean(self, value):
+        languages = super().clean(value)
+        return sum(
+            1 << self.bits[language]
+            for language in self.languages
+            if language in languages
+        )
+
+    def has_changed(self, initial, data):
+        return super().has_changed(self.prepare_value(initial or 0), data)
+
+
+class LanguageBitField(models.BigIntegerField):
+    """
+    Stores a boolean per language in one integer column, one bit per language
+
+    Created by ``TranslatedField(models.BooleanField(...), packed=True)``. The
+    field is named after the translated field, its column has a ``_bits``
+    suffix.
+
+    ``bits`` is a ``{language_code: bit}`` dict pinning the bit of each
+    language. Without it the bits follow the order of ``languages``, so adding,
+    removing or reordering languages moves the stored values to other
+    languages.
+    """
+
+    def __init__(self, *args, languages, bits=None, **kwargs):
+        self.languages = list(languages)
+        self._pinned = bits is not None
+        self.bits = (
+            dict(bits)
+            if bits is not None
+            else {language: index for index, language in enumerate(self.languages)}
+        )
+        if missing := [lang for lang in self.languages if lang not in self.bits]:
+            raise ImproperlyConfigured(
+                f"LanguageBitField has no bits for the languages {missing}."
+            )
+        if len(set(self.bits.values())) != len(self.bits) or not all(
+            0 <= bit < 63 for bit in self.bits.values()
+        ):
+            raise ImproperlyConfigured(
+                "LanguageBitField bits have to be unique and between 0 and 62."
+            )
+        kwargs.setdefault("default", 0)
+        super().__init__(*args, **kwargs)
+
+    @property
+    def full_mask(self):
+        return sum(1 << self.bits[language] for language in self.languages)
+
+    def language_mask(self, language_code):
+        if language_code not in self.languages:
+            raise ValueError(f"Unknown language '{language_code}' for '{self.name}'.")
+        return 1 << self.bits[language_code]
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["languages"] = self.languages
+        if self._pinned:
+            kwargs["bits"] = self.bits
+        return name, path, args, kwargs
+
+    def get_attname(self):
+        return f"{self.name}_bits"
+
+    def save_form_data(self, instance, data):
+        setattr(instance, self.attname, data)
+
+    def formfield(self, **kwargs):
+        widget = kwargs.get("widget")
+        if widget is not None and issubclass(
+            widget if isinstance(widget, type) else type(widget), forms.TextInput
+        ):
+            # The admin's widget for integer fields
+            del kwargs["widget"]
+        # Skip IntegerField.formfield which adds min_value and max_value
+        return models.Field.formfield(
+            self,
+            **{
+                "form_class": LanguageBitsFormField,
+                "languages": self.languages,
+                "bits": self.bits,
+                **kwargs,
+            },
+        )
+
+
+def language_bit(field, language_code):
+    """Return a property reading and writing the bit of ``language_code``"""
+    mask = field.language_mask(language_code)
+
+    def getter(obj):
+        return bool(getattr(obj, field.attname) & mask)
+
+    def setter(obj, value):
+        bits = getattr(obj, field.attname) or 0
+        setattr(obj, field.attname, bits | mask if value else bits & ~mask)
+
+    return property(getter, setter)
+
+
+class _BitLookup(Lookup):
+    prepare_rhs = False
+
+    def _bitand(self, compiler, connection):
+        lhs, params = self.process_lhs(compiler, connection)
+        return connection.ops.combine_expression("&", [lhs, "%s"]), params
+
+
+@LanguageBitField.register_lookup
+class InLanguage(_BitLookup):
+    """``field__in_language="de"``: the bit of the language is set"""
+
+    lookup_name = "in_language"
+
+    def as_sql(self, compiler, connection):
+        sql, params = self._bitand(compiler, connection)
+        return f"{sql} != 0", [*params, self.lhs.output_field.language_mask(self.rhs)]
+
+
+@LanguageBitField.register_lookup
+class AnyLanguage(_BitLookup):
+    """``field__any_language=True``: the bit of at least one language is set"""
+
+    lookup_name = "any_language"
+
+    def as_sql(self, compiler, connection):
+        sql, params = self._bitand(compiler, connection)
+        operator = "!=" if self.rhs else "="
+        return f"{sql} {operator} 0", [*params, self.lhs.output_field.full_mask]
+
+
+@LanguageBitField.register_lookup
+class AllLanguages(_BitLookup):
+    """``field__all_languages=True``: the bits of all languages are set"""
+
+    lookup_name = "all_languages"
+
+    def as_sql(self, compiler, connection):
+        sql, params = self._bitand(compiler, connection)
+        mask = self.lhs.output_field.full_mask
+        operator = "=" if self.rhs else "!="
+        return f"{sql} {operator} %s", [*params, mask, mask]
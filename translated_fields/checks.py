@@ -0,0 +1,139 @@
+from django.apps import apps
+from django.core import checks
+from django.db import connections
+
+from translated_fields.fields import _translated_fields
+
+
+# Per-backend table limits. "row_bytes" is the maximum row size excluding
+# columns which are stored off-page (MySQL's 65,535 byte limit).
+SCHEMA_LIMITS = {
+    "mysql": {"columns": 1017, "row_bytes": 65535},
+    "oracle": {"columns": 1000, "row_bytes": None},
+    "postgresql": {"columns": 1600, "row_bytes": None},
+    "sqlite": {"columns": 2000, "row_bytes": None},
+}
+
+# Warn when this share of a limit is reached.
+SCHEMA_WARNING_RATIO = 0.8
+
+# Bytes per column, mostly following MySQL's storage requirements.
+_FIXED_BYTES = {
+    "AutoField": 4,
+    "BigAutoField": 8,
+    "BigIntegerField": 8,
+    "BinaryField": 12,
+    "BooleanField": 1,
+    "DateField": 3,
+    "DateTimeField": 8,
+    "DurationField": 8,
+    "FloatField": 8,
+    "IntegerField": 4,
+    "JSONField": 12,
+    "PositiveBigIntegerField": 8,
+    "PositiveIntegerField": 4,
+    "PositiveSmallIntegerField": 2,
+    "SmallAutoField": 2,
+    "SmallIntegerField": 2,
+    "TextField": 12,
+    "TimeField": 3,
+    "UUIDField": 32 * 4 + 1,
+}
+
+
+def column_bytes(field):
+    """
+    Return the maximum number of bytes a field contributes to the row size,
+    assuming four bytes per character (MySQL's utf8mb4)
+    """
+    if field.is_relation:
+        return column_bytes(field.target_field)
+    internal_type = field.get_internal_type()
+    if internal_type in _FIXED_BYTES:
+        return _FIXED_BYTES[internal_type]
+    if internal_type == "DecimalField":
+        return (field.max_digits // 9 + 1) * 4
+    if max_length := getattr(field, "max_length", None):
+        return max_length * 4 + (1 if max_length * 4 < 256 else 2)
+    return 8
+
+
+def schema_footprint(model):
+    """
+    Return a dictionary describing the columns and the maximum row size of
+    the model's table and the part contributed by translated fields
+    """
+    translated = {
+        column
+        for field in _translated_fields(model).values()
+        for column in [*field.fields, *field.resolved_fields.values()]
+    }
+    fields = [field for field in model._meta.concrete_fields if field.column]
+    translated_fields = [field for field in fields if field.name in translated]
+    return {
+        "columns": len(fields),
+        "row_bytes": sum(column_bytes(field) for field in fields),
+        "translated_columns": len(translated_fields),
+        "translated_row_bytes": sum(column_bytes(field) for field in translated_fields),
+    }
+
+
+def _vendors(databases):
+    return sorted(
+        {connections[alias].vendor for alias in (databases or connections)}
+        & set(SCHEMA_LIMITS)
+    )
+
+
+def _limit_messages(model, footprint, vendor):
+    limits = SCHEMA_LIMITS[vendor]
+    messages = []
+    for key, what, error_id, warning_id in [
+        ("columns", "columns", "translated_fields.E001", "translated_fields.W001"),
+        (
+            "row_bytes",
+            "bytes per row",
+            "translated_fields.E002",
+            "translated_fields.W002",
+        ),
+    ]:
+        limit = limits[key]
+        value = footprint[key]
+        if not limit or value < limit * SCHEMA_WARNING_RATIO:
+            continue
+        message = (
+            f"The table of '{model._meta.label}' has {value} {what}"
+            f" ({footprint[f'translated_{key}']} from translated fields),"
+            f" {vendor} allows at most {limit}."
+        )
+        hint = (
+            "Reduce the number of languages using the 'languages' argument, or"
+            " reduce field sizes per language using the 'specific' argument."
+            " Run 'manage.py translated_schema_report' for details."
+        )
+        if value > limit:
+            messages.append(checks.Error(message, hint=hint, obj=model, id=error_id))
+        else:
+            messages.append(
+                checks.Warning(message, hint=hint, obj=model, id=warning_id)
+            )
+    return messages
+
+
+@checks.register(checks.Tags.models)
+def check_translated_schema(app_configs=None, databases=None, **kwargs):
+    if app_configs is None:
+        models = apps.get_models()
+    else:
+        models = [model for config in app_configs for model in config.get_models()]
+
+    messages = []
+    vendors = _vendors(databases)
+    for model in models:
+        opts = model._meta
+        if not opts.managed or opts.proxy or not _translated_fields(model):
+            continue
+        footprint = schema_footprint(model)
+        for vendor in vendors:
+            messages.extend(_limit_messages(model, footprint, vendor))
+    return messages
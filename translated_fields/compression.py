@@ -0,0 +1,171 @@
+import base64
+import bz2
+import lzma
+import zlib
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections, models
+
+from translated_fields.search import _sync_index
+
+
+__all__ = [
+    "CompressedTextField",
+    "compress",
+    "decompress",
+    "recompress",
+    "register_codec",
+]
+
+
+# Prefix of compressed values, followed by "<codec>:<base64 data>"
+MARKER = "\x01"
+
+_codecs = {}
+
+
+def register_codec(name, compress, decompress):
+    """
+    Register a codec; ``compress`` and ``decompress`` accept and return bytes
+
+    The name is stored with each compressed value, codecs have to stay
+    registered as long as values compressed using them exist.
+    """
+    if ":" in name:
+        raise ValueError(f"Invalid codec name '{name}'.")
+    _codecs[name] = (compress, decompress)
+
+
+register_codec("zlib", zlib.compress, zlib.decompress)
+register_codec("bz2", bz2.compress, bz2.decompress)
+register_codec("lzma", lzma.compress, lzma.decompress)
+
+try:
+    from compression import zstd  # Python >= 3.14
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+if zstd is not None:
+    register_codec("zstd", zstd.compress, zstd.decompress)
+
+
+def compress(value, codec="zlib"):
+    """Return the compressed representation of the string ``value``"""
+    data = _codecs[codec][0](value.encode())
+    return f"{MARKER}{codec}:{base64.b64encode(data).decode('ascii')}"
+
+
+def decompress(value):
+    """
+    Return the string compressed by ``compress``, all other values are
+    returned as-is
+    """
+    if not isinstance(value, str) or not value.startswith(MARKER):
+        return value
+    codec, _sep, data = value[1:].partition(":")
+    try:
+        decompress = _codecs[codec][1]
+    except KeyError:
+        raise ValueError(f"Unknown compression codec '{codec}'.") from None
+    return decompress(base64.b64decode(data)).decode()
+
+
+class CompressedTextField(models.TextField):
+    """
+    Text field storing values of at least ``threshold`` characters compressed
+    using ``codec``
+
+    Values are compressed when saving and decompressed when loading, also
+    when using ``values()`` or ``values_list()``. Shorter values and values
+    which do not get shorter when compressed are stored as-is. The database
+    only sees the compressed representation, so lookups other than ``exact``
+    and ``isnull`` do not work for compressed values.
+    """
+
+    def __init__(self, *args, codec="zlib", threshold=1024, **kwargs):
+        if codec not in _codecs:
+            raise ImproperlyConfigured(f"Unknown compression codec '{codec}'.")
+        self.codec = codec
+        self.threshold = threshold
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.codec != "zlib":
+            kwargs["codec"] = self.codec
+        if self.threshold != 1024:
+            kwargs["threshold"] = self.threshold
+        return name, path, args, kwargs
+
+    def from_db_value(self, value, expression, connection):
+        return decompress(value)
+
+    def get_db_prep_save(self, value, connection):
+        value = super().get_db_prep_save(value, connection)
+        if not isinstance(value, str):
+            return value
+        if value.startswith(MARKER):
+            # Plain values have to be distinguishable from compressed values
+            return compress(value, self.codec)
+        if len(value) >= self.threshold:
+            compressed = compress(value, self.codec)
+            if len(compressed) < len(value):
+                return compressed
+        return value
+
+
+def recompress(model, *, chunk_size=1000, using=DEFAULT_DB_ALIAS):
+    """
+    Rewrite the values of all ``CompressedTextField`` columns of ``model``
+    which aren't stored according to the field's current codec and threshold
+    and return the number of updated rows
+
+    Use this e.g. in a ``RunPython`` migration after switching a text field to
+    ``CompressedTextField`` or after changing the codec or threshold.
+    """
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if isinstance(field, CompressedTextField)
+    ]
+    if not fields:
+        return 0
+    connection = connections[using]
+    attnames = [field.attname for field in fields]
+    # Select the stored representation, not the decompressed values
+    queryset = (
+        model._base_manager.using(using)
+        .annotate(
+            **{
+                f"_stored_{attname}": models.ExpressionWrapper(
+                    models.F(attname), output_field=models.TextField()
+                )
+                for attname in attnames
+            }
+        )
+        .values_list("pk", *(f"_stored_{attname}" for attname in attnames))
+        .order_by("pk")
+    )
+    count = 0
+    last = None
+    while True:
+        rows = list(
+            (queryset if last is None else queryset.filter(pk__gt=last))[:chunk_size]
+        )
+        if not rows:
+            return count
+        changed = []
+        for pk, *stored in rows:
+            values = dict(zip(attnames, map(decompress, stored)))
+            if any(
+                value != field.get_db_prep_save(values[field.attname], connection)
+                for field, value in zip(fields, stored)
+            ):
+                changed.append(model(pk=pk, **values))
+        if changed:
+            model._base_manager.using(using).bulk_update(changed, attnames)
+            _sync_index(model, [obj.pk for obj in changed], attnames, using=using)
+            count += len(changed)
+        last = rows[-1][0]
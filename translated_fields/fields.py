@@ -1,16 +1,36 @@
 import contextvars
+import functools
+import hashlib
 import re
 from contextlib import contextmanager
 
 from django.conf import settings
-from django.db.models import Field
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.db.models import BooleanField, CharField, F, Field, TextField, Value
+from django.db.models.functions import Coalesce, NullIf
+from django.db.models.signals import class_prepared, pre_save
+from django.utils.encoding import force_str
 from django.utils.functional import lazy
-from django.utils.text import capfirst
+from django.utils.hashable import make_hashable
+from django.utils.text import capfirst, format_lazy
 from django.utils.translation import get_language
 
+from translated_fields.bitfield import LanguageBitField, language_bit
+
+
+try:
+    from django.db.models import GeneratedField
+except ImportError:  # Django < 5.0
+    GeneratedField = None
+
 
 __all__ = [
+    "instance_language",
+    "language_aliases",
+    "served_languages",
     "show_language_code",
+    "source_hash",
     "TranslatedField",
     "to_attribute",
     "translated_attrgetter",
@@ -30,27 +50,116 @@ def show_language_code(show):
 
 
 def _verbose_name_maybe_language_code(verbose_name, language_code):
+    # {(active language, show language code): label}
+    labels = {}
+
     def verbose_name_fn():
-        if _show_language_code.get(False):
-            return f"{capfirst(verbose_name)} [{language_code}]"
-        return str(verbose_name)
+        key = (get_language(), _show_language_code.get(False))
+        try:
+            return labels[key]
+        except KeyError:
+            pass
+        if key[1]:
+            label = f"{capfirst(verbose_name)} [{language_code}]"
+        else:
+            label = str(verbose_name)
+        labels[key] = label
+        return label
 
     return lazy(verbose_name_fn, str)()
 
 
+def served_languages(languages):
+    """
+    Return the subset of ``languages`` which are listed in the
+    ``TRANSLATED_FIELDS_SERVED_LANGUAGES`` setting (all languages if the
+    setting is ``None`` or missing)
+    """
+    served = getattr(settings, "TRANSLATED_FIELDS_SERVED_LANGUAGES", None)
+    if served is None:
+        return list(languages)
+    return [language for language in languages if language in served]
+
+
+# {TranslatedField: served languages}
+_served_languages = {}
+
+
+def _served_field_languages(field):
+    """Return ``served_languages(field.languages)``, cached per field"""
+    try:
+        return _served_languages[field]
+    except KeyError:
+        served = _served_languages[field] = served_languages(field.languages)
+        return served
+
+
+def _clear_served_languages(*, setting, **kwargs):
+    if setting == "TRANSLATED_FIELDS_SERVED_LANGUAGES":
+        _served_languages.clear()
+
+
+setting_changed.connect(_clear_served_languages)
+
+
 def to_attribute(name, language_code=None):
     language = language_code or get_language()
     return re.sub(r"[^a-z0-9_]+", "_", (f"{name}_{language}").lower())
 
 
+def language_aliases():
+    """
+    Return the ``TRANSLATED_FIELDS_LANGUAGE_ALIASES`` setting, a
+    ``{alias: language_code}`` dict of languages which use the column of
+    another language
+    """
+    return getattr(settings, "TRANSLATED_FIELDS_LANGUAGE_ALIASES", None) or {}
+
+
+def _language_value(obj, name, field, language_code, *default):
+    """
+    Return the value of ``language_code`` resolving language aliases and
+    using the alias' override if it is set
+    """
+    if language_code in field.aliases:
+        if language_code in field.alias_overrides:
+            value = getattr(obj, to_attribute(name, language_code))
+            if not _is_empty(value):
+                return value
+        language_code = field.aliases[language_code]
+    value = getattr(obj, to_attribute(name, language_code), *default)
+    if value is None and field.inherit_primary:
+        # Inherited from the primary language
+        return getattr(obj, to_attribute(name, field.languages[0]))
+    return value
+
+
+def instance_language(obj):
+    """
+    Return the language bound to ``obj`` by ``TranslatedQuerySet.with_language``
+    or the active language
+    """
+    return getattr(obj, "__dict__", {}).get("_translated_language") or get_language()
+
+
 def translated_attrgetter(name, field):
-    return lambda self: getattr(
-        self, to_attribute(name, get_language() or field.languages[0])
+    return lambda self: _language_value(
+        self,
+        name,
+        field,
+        instance_language(self)
+        or (_served_field_languages(field) or field.languages)[0],
     )
 
 
 def translated_attrsetter(name, field):
-    return lambda self, value: setattr(self, to_attribute(name), value)
+    def setter(self, value):
+        language = instance_language(self)
+        if language not in field.alias_overrides:
+            language = field.aliases.get(language, language)
+        setattr(self, to_attribute(name, language), value)
+
+    return setter
 
 
 def translated_attributes(*names, attrgetter=translated_attrgetter):
@@ -64,23 +173,202 @@ def translated_attributes(*names, attrgetter=translated_attrgetter):
     return decorator
 
 
+def _is_text(field):
+    return isinstance(field, (CharField, TextField))
+
+
+def _resolved_expression(field, attribute, primary):
+    value = F(attribute)
+    if _is_text(field):
+        value = NullIf(value, Value(""))
+    return Coalesce(value, F(primary))
+
+
+def _is_empty(value):
+    return value is None or value == ""
+
+
+def source_hash(value):
+    """Return the 16 characters long hash stored for source values"""
+    if _is_empty(value):
+        return ""
+    return hashlib.blake2b(str(value).encode(), digest_size=8).hexdigest()
+
+
+class _InheritingTextMixin:
+    """
+    Text column of an ``inherit_primary`` field; ``NULL`` is the marker for
+    inherited values, so forms never write ``NULL``
+    """
+
+    def formfield(self, **kwargs):
+        # Blank translations stay blank instead of inheriting
+        return super().formfield(**{"empty_value": "", **kwargs})
+
+    def save_form_data(self, instance, data):
+        # Inherited values are shown as blank, keep inheriting if unchanged
+        if data == "" and getattr(instance, self.attname) is None:
+            return
+        super().save_form_data(instance, data)
+
+
+@functools.cache
+def _inheriting_text_class(field_class):
+    return type(
+        field_class.__name__,
+        (_InheritingTextMixin, field_class),
+        # deconstruct() still returns the path of field_class
+        {
+            "__module__": field_class.__module__,
+            "__qualname__": field_class.__qualname__,
+        },
+    )
+
+
+def _display_choices(field):
+    return {make_hashable(value): label for value, label in field.flatchoices}
+
+
+def _get_translated_display(obj, *, field):
+    language = instance_language(obj)
+    language = field.aliases.get(language, language)
+    choices = field._display_choices.get(language) or field._display_choices.get(
+        field.languages[0], {}
+    )
+    value = field.__get__(obj)
+    return force_str(choices.get(make_hashable(value), value), strings_only=True)
+
+
+def _connect(signal, receiver, model, dispatch_uid):
+    """
+    Connect ``receiver`` to ``signal`` for ``model`` or for all concrete
+    subclasses if ``model`` is abstract
+    """
+    if not model._meta.abstract:
+        signal.connect(receiver, sender=model, weak=False, dispatch_uid=dispatch_uid)
+        return
+
+    def connect(sender, **kwargs):
+        if issubclass(sender, model) and not sender._meta.abstract:
+            signal.connect(
+                receiver,
+                sender=sender,
+                weak=False,
+                dispatch_uid=f"{dispatch_uid}_{sender._meta.label}",
+            )
+
+    class_prepared.connect(connect, weak=False)
+
+
+# Keyword arguments of the translated field which aren't passed on to the
+# field holding the resolved value.
+_UNRESOLVED_KWARGS = {
+    "blank",
+    "choices",
+    "db_column",
+    "db_comment",
+    "db_default",
+    "db_index",
+    "default",
+    "editable",
+    "help_text",
+    "null",
+    "primary_key",
+    "unique",
+    "validators",
+}
+
+
 class TranslatedField:
     def __init__(
-        self, field, specific=None, *, languages=None, attrgetter=None, attrsetter=None
+        self,
+        field,
+        specific=None,
+        *,
+        languages=None,
+        attrgetter=None,
+        attrsetter=None,
+        resolved=False,
+        track_sources=False,
+        aliases=None,
+        alias_overrides=(),
+        inherit_primary=False,
+        packed=False,
+        searchable=False,
     ):
+        if packed and not isinstance(field, BooleanField):
+            raise ImproperlyConfigured("Only boolean fields can be packed.")
+        if searchable and not _is_text(field):
+            raise ImproperlyConfigured("Only text fields can be searchable.")
+        self.packed = packed
+        # Indexed by translated_fields.search
+        self.searchable = searchable
         self._field = field
         self._specific = specific or {}
+        self.inherit_primary = inherit_primary
         self._attrgetter = attrgetter or translated_attrgetter
         self._attrsetter = attrsetter or translated_attrsetter
-        self.languages = list(languages or (lang[0] for lang in settings.LANGUAGES))
+        aliases = {**language_aliases(), **(aliases or {})}
+        self.languages = list(
+            languages
+            or (
+                lang[0]
+                for lang in settings.LANGUAGES
+                if lang[0] not in aliases or lang[0] in alias_overrides
+            )
+        )
+        # {alias: language_code} of languages without a column of their own
+        # (or with a column only containing overrides)
+        self.aliases = {
+            alias: language
+            for alias, language in aliases.items()
+            if language in self.languages
+            and (alias not in self.languages or alias in alias_overrides)
+        }
+        self.alias_overrides = frozenset(
+            alias for alias in alias_overrides if alias in self.aliases
+        )
+        for alias in self.alias_overrides:
+            # Empty overrides use the value of the aliased language
+            self._specific.setdefault(alias, {}).setdefault("blank", True)
+            if not _is_text(field):
+                self._specific[alias].setdefault("null", True)
+        if inherit_primary:
+            for language in self.languages[1:]:
+                # NULL inherits the primary language's value
+                self._specific.setdefault(language, {})["null"] = True
+        self._resolved = [
+            language
+            for language in self.languages[1:]
+            if resolved is True or (resolved and language in resolved)
+        ]
+        # {language_code: attribute} of columns holding resolved values
+        self.resolved_fields = {}
+        self._track_sources = track_sources
+        # {language_code: (source hash attribute, stale attribute)}
+        self.source_fields = {}
 
         # Make space for our fields.
         self.creation_counter = Field.creation_counter
-        Field.creation_counter += len(self.languages)
+        Field.creation_counter += (
+            1
+            if packed
+            else (
+                len(self.languages)
+                + len(self._resolved)
+                + (2 * len(self.languages[1:]) if track_sources else 0)
+            )
+        )
 
     def contribute_to_class(self, cls, name):
+        if self.packed:
+            return self._contribute_packed(cls, name)
+
         _n, _p, args, kwargs = self._field.deconstruct()
         fields = []
+        # {language_code: {value: label}} for get_<name>_display
+        self._display_choices = {}
+        shared_choices = None
         verbose_name = kwargs.pop("verbose_name", name)
         for index, language_code in enumerate(self.languages):
             field_kw = dict(kwargs, **self._specific.get(language_code, {}))
@@ -88,20 +376,233 @@ class TranslatedField:
                 "verbose_name",
                 _verbose_name_maybe_language_code(verbose_name, language_code),
             )
-            f = self._field.__class__(*args, **field_kw)
+            field_class = self._field.__class__
+            if self.inherit_primary and index and _is_text(self._field):
+                field_class = _inheriting_text_class(field_class)
+            f = field_class(*args, **field_kw)
             f._translated_field_language_code = language_code
             f.creation_counter = self.creation_counter + index
             attr = to_attribute(name, language_code)
             f.contribute_to_class(cls, attr)
             fields.append(attr)
+            if f.choices:
+                if "choices" in self._specific.get(language_code, {}):
+                    self._display_choices[language_code] = _display_choices(f)
+                else:
+                    # Languages without overrides share one dict
+                    if shared_choices is None:
+                        shared_choices = _display_choices(f)
+                    self._display_choices[language_code] = shared_choices
+
+        for index, language_code in enumerate(self._resolved, len(self.languages)):
+            f = self._resolved_field(
+                args,
+                kwargs,
+                _verbose_name_maybe_language_code(
+                    format_lazy("{} (resolved)", verbose_name), language_code
+                ),
+                to_attribute(name, language_code),
+                fields[0],
+            )
+            f._translated_field_language_code = language_code
+            f.creation_counter = self.creation_counter + index
+            attr = f"{to_attribute(name, language_code)}_resolved"
+            f.contribute_to_class(cls, attr)
+            self.resolved_fields[language_code] = attr
+
+        if self._track_sources:
+            if not hasattr(cls, "_changed_translated_attnames"):
+                raise ImproperlyConfigured(
+                    f"'{cls.__name__}.{name}' uses track_sources, which requires"
+                    " the DirtyTrackingMixin model mixin."
+                )
+            index = len(self.languages) + len(self._resolved)
+            for language_code in self.languages[1:]:
+                attr = to_attribute(name, language_code)
+                for suffix, f in [
+                    (
+                        "source",
+                        CharField(
+                            format_lazy("{} (source hash)", verbose_name),
+                            max_length=16,
+                            blank=True,
+                            editable=False,
+                        ),
+                    ),
+                    (
+                        "stale",
+                        BooleanField(
+                            format_lazy("{} (stale)", verbose_name),
+                            default=False,
+                            db_index=True,
+                            editable=False,
+                        ),
+                    ),
+                ]:
+                    f._translated_field_language_code = language_code
+                    f.creation_counter = self.creation_counter + index
+                    f.contribute_to_class(cls, f"{attr}_{suffix}")
+                    index += 1
+                self.source_fields[language_code] = (f"{attr}_source", f"{attr}_stale")
 
         setattr(cls, name, self)
+        self.name = name
         self.fields = fields
         self.short_description = verbose_name
+        if self._display_choices and f"get_{name}_display" not in cls.__dict__:
+            # Like Django's get_FOO_display methods
+            setattr(
+                cls,
+                f"get_{name}_display",
+                functools.partialmethod(_get_translated_display, field=self),
+            )
+
+        if self._auxiliary_fields() or self.inherit_primary:
+            _connect(
+                pre_save,
+                self._pre_save,
+                cls,
+                f"translated_fields_auxiliary_{cls._meta.label}_{name}",
+            )
+
+        self._getter = self._attrgetter(name, field=self)
+        self._setter = self._attrsetter(name, field=self)
+
+    def _contribute_packed(self, cls, name):
+        _n, _p, _args, kwargs = self._field.deconstruct()
+        verbose_name = kwargs.get("verbose_name", name)
+        f = LanguageBitField(
+            verbose_name,
+            languages=self.languages,
+            # packed={language_code: bit} pins the bits
+            bits=None if self.packed is True else self.packed,
+            blank=True,
+            help_text=kwargs.get("help_text", ""),
+        )
+        if kwargs.get("default"):
+            f.default = f.full_mask
+        f.creation_counter = self.creation_counter
+        f.contribute_to_class(cls, name)
 
+        self.fields = []
+        for language_code in self.languages:
+            attr = to_attribute(name, language_code)
+            setattr(cls, attr, language_bit(f, language_code))
+            self.fields.append(attr)
+
+        setattr(cls, name, self)
+        self.name = name
+        self.short_description = verbose_name
         self._getter = self._attrgetter(name, field=self)
         self._setter = self._attrsetter(name, field=self)
 
+    def _resolved_field(self, args, kwargs, verbose_name, attribute, primary):
+        field_kw = {
+            key: value for key, value in kwargs.items() if key not in _UNRESOLVED_KWARGS
+        }
+        field_kw["verbose_name"] = verbose_name
+        output_field = self._field.__class__(*args, **field_kw)
+        if GeneratedField is None:
+            return self._field.__class__(
+                *args,
+                **field_kw,
+                null=kwargs.get("null", False),
+                blank=True,
+                editable=False,
+                db_index=True,
+            )
+        return GeneratedField(
+            expression=_resolved_expression(output_field, attribute, primary),
+            output_field=output_field,
+            db_persist=True,
+            db_index=True,
+            verbose_name=verbose_name,
+        )
+
+    def _auxiliary_fields(self):
+        """
+        Return the names of columns which are computed when saving instances
+        """
+        fields = [] if GeneratedField else list(self.resolved_fields.values())
+        fields.extend(attr for attrs in self.source_fields.values() for attr in attrs)
+        return fields
+
+    def _pre_save(self, sender, instance, **kwargs):
+        self._update_auxiliary_fields(instance)
+
+    def _update_auxiliary_fields(self, instance):
+        if self.inherit_primary:
+            self._compact(instance)
+        if GeneratedField is None and self.resolved_fields:
+            self._fill_resolved_fields(instance)
+        if self.source_fields:
+            self._update_source_fields(instance)
+
+    def _compact(self, instance):
+        primary = getattr(instance, self.fields[0])
+        if _is_empty(primary):
+            return
+        values = instance.__dict__
+        for attr in self._compactable_fields():
+            if attr in values and values[attr] == primary:
+                setattr(instance, attr, None)
+
+    def _compactable_fields(self):
+        # Empty overrides use the aliased language, not the primary language
+        return [
+            attr
+            for language, attr in zip(self.languages[1:], self.fields[1:])
+            if language not in self.alias_overrides
+        ]
+
+    def _fill_resolved_fields(self, instance):
+        primary = getattr(instance, self.fields[0])
+        text = _is_text(self._field)
+        for language, attribute in self.resolved_fields.items():
+            value = getattr(instance, to_attribute(self.name, language))
+            empty = value is None or (text and value == "")
+            setattr(instance, attribute, primary if empty else value)
+
+    def _update_source_fields(self, instance):
+        # Changes since loading or saving, see DirtyTrackingMixin
+        changed = instance._changed_translated_attnames()
+        opts = instance._meta
+        primary_changed = opts.get_field(self.fields[0]).attname in changed
+        written = {
+            attr for attr in self.fields[1:] if opts.get_field(attr).attname in changed
+        }
+        if primary_changed or written:
+            digest = source_hash(getattr(instance, self.fields[0]))
+            for language, attr in zip(self.languages[1:], self.fields[1:]):
+                source, stale = self.source_fields[language]
+                if attr in written:
+                    empty = _is_empty(getattr(instance, attr))
+                    setattr(instance, source, "" if empty else digest)
+                    setattr(instance, stale, False)
+                elif primary_changed:
+                    setattr(
+                        instance,
+                        stale,
+                        not _is_empty(getattr(instance, attr))
+                        and getattr(instance, source) != digest,
+                    )
+
+    def resolved_attribute(self, language_code=None):
+        """
+        Return the name of the column holding the value of the active language
+        with a fallback to the first language if the field has been declared
+        with ``resolved``, the name of the language's column otherwise
+        """
+        language = language_code or get_language()
+        language = self.aliases.get(language, language)
+        if language not in self.languages:
+            language = self.languages[0]
+        return self.resolved_fields.get(language) or to_attribute(self.name, language)
+
+    @property
+    def admin_order_field(self):
+        return None if self.packed else self.resolved_attribute()
+
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
@@ -109,3 +610,46 @@ class TranslatedField:
 
     def __set__(self, obj, value):
         self._setter(obj, value)
+
+
+def _translated_fields(model):
+    """
+    Return a ``{name: TranslatedField}`` dict of the model's translated fields
+    with a column per language
+    """
+    return {
+        name: value
+        for cls in reversed(model.__mro__)
+        for name, value in vars(cls).items()
+        if isinstance(value, TranslatedField)
+        and hasattr(value, "fields")
+        # Packed fields do not have a column per language
+        and not value.packed
+    }
+
+
+def _auxiliary_fields_for(model, fields):
+    """
+    Return the names of computed columns which depend on the translated
+    columns ``fields``
+    """
+    fields = set(fields)
+    return [
+        attr
+        for field in _translated_fields(model).values()
+        if fields.intersection(field.fields)
+        for attr in field._auxiliary_fields()
+    ]
+
+
+@functools.cache
+def _translated_attnames(model):
+    """
+    Return a ``{attname: (name, language_code)}`` dict of the model's
+    translated columns
+    """
+    return {
+        model._meta.get_field(column).attname: (name, language)
+        for name, field in _translated_fields(model).items()
+        for language, column in zip(field.languages, field.fields)
+    }
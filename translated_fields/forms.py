@@ -0,0 +1,120 @@
+from django import forms
+
+from translated_fields.fields import _auxiliary_fields_for, _translated_fields
+from translated_fields.utils import language_code_formfield_callback
+
+
+__all__ = ["TranslatedModelForm", "translated_modelform_factory"]
+
+
+def _translated_columns(model):
+    return {
+        column: language
+        for field in _translated_fields(model).values()
+        for language, column in zip(field.languages, field.fields)
+    }
+
+
+class TranslatedModelForm(forms.ModelForm):
+    """
+    Model form which only cleans and validates the translated fields which
+    have been changed when editing existing objects, and only saves changed
+    translated fields
+    """
+
+    def full_clean(self):
+        if not self.is_bound or self.instance._state.adding:
+            return super().full_clean()
+
+        # Fields missing from self.fields are neither cleaned nor validated
+        # and construct_instance() leaves the instance's values alone.
+        translated = _translated_columns(self._meta.model)
+        changed = set(self.changed_data)
+        fields = self.fields
+        self.fields = {
+            name: field
+            for name, field in fields.items()
+            if name not in translated or name in changed
+        }
+        try:
+            super().full_clean()
+        finally:
+            self.fields = fields
+
+    def save(self, commit=True):  # noqa: FBT002
+        if not commit or self.instance._state.adding or self.errors:
+            return super().save(commit=commit)
+
+        # Leave unchanged translated columns alone, values set elsewhere
+        # (auto_now, Model.clean()) are saved
+        translated = _translated_columns(self._meta.model)
+        changed = set(self.changed_data)
+        update_fields = [
+            field.name
+            for field in self.instance._meta.concrete_fields
+            if not field.primary_key
+            and not getattr(field, "generated", False)
+            and (field.name not in translated or field.name in changed)
+        ]
+        self.instance.save(
+            update_fields=list(
+                dict.fromkeys(
+                    [
+                        *update_fields,
+                        *_auxiliary_fields_for(self._meta.model, update_fields),
+                    ]
+                )
+            )
+        )
+        self._save_m2m()
+        return self.instance
+
+
+_form_classes = {}
+
+
+def translated_modelform_factory(
+    model, *, languages=None, form=TranslatedModelForm, **kwargs
+):
+    """
+    Return a model form class for ``model`` containing the fields of
+    ``languages`` (all languages if ``None``) and all fields which aren't
+    translated
+
+    Labels contain the language code by default. Form classes are cached per
+    language set if all arguments are hashable.
+    """
+    kwargs.setdefault("formfield_callback", language_code_formfield_callback)
+    key = (
+        model,
+        form,
+        None if languages is None else tuple(languages),
+        tuple(
+            sorted(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in kwargs.items()
+            )
+        ),
+    )
+    try:
+        return _form_classes[key]
+    except TypeError:
+        key = None
+    except KeyError:
+        pass
+
+    if languages is not None:
+        kwargs["exclude"] = [
+            *(kwargs.get("exclude") or ()),
+            *(
+                column
+                for column, language in _translated_columns(model).items()
+                if language not in languages
+            ),
+        ]
+    elif "fields" not in kwargs and "exclude" not in kwargs:
+        kwargs["fields"] = "__all__"
+    form_class = forms.modelform_factory(model, form=form, **kwargs)
+    if key is not None:
+        _form_classes[key] = form_class
+    return form_class
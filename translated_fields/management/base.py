@@ -0,0 +1,21 @@
+from django.apps import apps
+from django.core.management.base import CommandError
+
+
+def labeled_models(labels):
+    """
+    Return the models of the ``app_label`` and ``app_label.ModelName``
+    ``labels`` passed to a management command (all models if empty)
+    """
+    if not labels:
+        return apps.get_models()
+    models = []
+    try:
+        for label in labels:
+            if "." in label:
+                models.append(apps.get_model(label))
+            else:
+                models.extend(apps.get_app_config(label).get_models())
+    except LookupError as exc:
+        raise CommandError(str(exc)) from exc
+    return list(dict.fromkeys(models))
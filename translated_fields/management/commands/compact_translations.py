@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F, Q
+
+from translated_fields.fields import _is_text, _translated_fields
+from translated_fields.management.base import labeled_models
+from translated_fields.search import _sync_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Replace translations identical to the primary language with NULL for"
+        " fields using inherit_primary."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            metavar="app_label[.ModelName]",
+            help="Limit compaction to the given apps or models.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="The number of rows updated per query.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to compact.",
+        )
+
+    def handle(self, *, labels, chunk_size, database, **options):
+        for model in self._models(labels):
+            count = self._compact(model, chunk_size=chunk_size, using=database)
+            self.stdout.write(f"{model._meta.label}: {count} translations compacted")
+
+    def _models(self, labels):
+        return [
+            model
+            for model in labeled_models(labels)
+            if not model._meta.proxy
+            and any(
+                field.inherit_primary for field in _translated_fields(model).values()
+            )
+        ]
+
+    def _compact(self, model, *, chunk_size, using):
+        columns = []
+        for field in _translated_fields(model).values():
+            if not field.inherit_primary:
+                continue
+            primary = field.fields[0]
+            for column in field._compactable_fields():
+                q = Q(**{column: F(primary)})
+                if _is_text(field._field):
+                    # Intentionally blank translations of empty values stay
+                    q &= ~Q(**{primary: ""})
+                columns.append((column, q))
+        queryset = model._base_manager.using(using).order_by("pk")
+        count = 0
+        last = None
+        while True:
+            pks = list(
+                (
+                    queryset if last is None else queryset.filter(pk__gt=last)
+                ).values_list("pk", flat=True)[:chunk_size]
+            )
+            if not pks:
+                return count
+            chunk = queryset.filter(pk__gte=pks[0], pk__lte=pks[-1])
+            with transaction.atomic(using=using):
+                for column, q in columns:
+                    count += chunk.filter(q).update(**{column: None})
+                _sync_index(model, pks, [column for column, _q in columns], using=using)
+            last = pks[-1]
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from translated_fields.management.base import labeled_models
+from translated_fields.search import _search_models, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search indexes of searchable translated fields."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            metavar="app_label[.ModelName]",
+            help="Limit rebuilding to the given apps or models.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="The number of rows indexed at once.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to index.",
+        )
+
+    def handle(self, *, labels, chunk_size, database, **options):
+        models = _search_models()
+        if labels:
+            selected = set(labeled_models(labels))
+            models = [model for model in models if model in selected]
+        for model in models:
+            count = rebuild_index(model, chunk_size=chunk_size, using=database)
+            self.stdout.write(f"{model._meta.label}: {count} rows indexed")
@@ -0,0 +1,133 @@
+import math
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Avg, Count, Max, Q
+from django.db.models.functions import Length
+
+from translated_fields.checks import SCHEMA_LIMITS, column_bytes, schema_footprint
+from translated_fields.fields import _is_text, _translated_fields
+from translated_fields.management.base import labeled_models
+
+
+# Suggest a smaller max_length when the longest value uses less than this
+# share of the current max_length.
+SHRINK_RATIO = 0.5
+# Suggest compact storage when at least this share of values is empty.
+EMPTY_RATIO = 0.9
+
+
+class Command(BaseCommand):
+    help = "Report the schema footprint of translated fields."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            metavar="app_label[.ModelName]",
+            help="Limit the report to the given apps or models.",
+        )
+        parser.add_argument(
+            "--no-data",
+            action="store_false",
+            dest="data",
+            help="Do not collect statistics about the stored values.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to collect statistics from.",
+        )
+
+    def handle(self, *, labels, data, database, **options):
+        for model in self._models(labels):
+            self._report(model, data=data, using=database)
+
+    def _models(self, labels):
+        return [
+            model
+            for model in labeled_models(labels)
+            if not model._meta.proxy and _translated_fields(model)
+        ]
+
+    def _report(self, model, *, data, using):
+        footprint = schema_footprint(model)
+        self.stdout.write(f"{model._meta.label} ({model._meta.db_table})")
+        self.stdout.write(
+            f"  columns: {footprint['columns']}"
+            f" ({footprint['translated_columns']} translated)"
+        )
+        self.stdout.write(
+            f"  max. row size: {footprint['row_bytes']} bytes"
+            f" ({footprint['translated_row_bytes']} translated)"
+        )
+        for vendor, limits in sorted(SCHEMA_LIMITS.items()):
+            usage = [f"{footprint['columns'] / limits['columns']:.0%} of columns"]
+            if limits["row_bytes"]:
+                usage.append(
+                    f"{footprint['row_bytes'] / limits['row_bytes']:.0%} of row size"
+                )
+            self.stdout.write(f"  {vendor}: {', '.join(usage)}")
+
+        stats = self._stats(model, using) if data else None
+        for name, translated_field in _translated_fields(model).items():
+            self.stdout.write(f"  {name}:")
+            for column in translated_field.fields:
+                field = model._meta.get_field(column)
+                line = f"    {column}: {column_bytes(field)} bytes"
+                if stats is not None and _is_text(field):
+                    line += (
+                        f", max. length {stats[f'{column}__max'] or 0},"
+                        f" avg. length {stats[f'{column}__avg'] or 0:.1f},"
+                        f" {stats[f'{column}__empty']}/{stats['total']} empty"
+                    )
+                self.stdout.write(line)
+            if stats is not None:
+                for suggestion in self._suggestions(model, translated_field, stats):
+                    self.stdout.write(f"    suggestion: {suggestion}")
+
+    def _stats(self, model, using):
+        aggregates = {"total": Count("pk")}
+        for translated_field in _translated_fields(model).values():
+            for column in translated_field.fields:
+                if not _is_text(model._meta.get_field(column)):
+                    continue
+                aggregates[f"{column}__max"] = Max(Length(column))
+                aggregates[f"{column}__avg"] = Avg(Length(column))
+                aggregates[f"{column}__empty"] = Count(
+                    "pk", filter=Q(**{column: ""}) | Q(**{f"{column}__isnull": True})
+                )
+        return model._base_manager.using(using).aggregate(**aggregates)
+
+    def _suggestions(self, model, translated_field, stats):
+        if not stats["total"]:
+            return
+        specific = {}
+        empty = []
+        for language, column in zip(
+            translated_field.languages, translated_field.fields
+        ):
+            field = model._meta.get_field(column)
+            if not _is_text(field):
+                continue
+            max_length = stats[f"{column}__max"] or 0
+            if (
+                field.get_internal_type() == "CharField"
+                and field.max_length
+                and max_length < field.max_length * SHRINK_RATIO
+            ):
+                # Leave some headroom and round to a multiple of ten
+                suggested = max(10, math.ceil(max_length * 1.25 / 10) * 10)
+                if suggested < field.max_length:
+                    specific[language] = {"max_length": suggested}
+            if stats[f"{column}__empty"] / stats["total"] >= EMPTY_RATIO:
+                empty.append(language)
+
+        if specific:
+            yield f"reduce the size of columns using specific={specific!r}"
+        if empty:
+            yield (
+                f"the columns of {', '.join(empty)} are mostly empty; drop these"
+                " languages using the 'languages' argument or move the field to"
+                " a more compact storage (e.g. a separate translations table)"
+            )
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from translated_fields.fields import _translated_fields
+from translated_fields.management.base import labeled_models
+from translated_fields.reporting import drop_views, regenerate_views
+
+
+class Command(BaseCommand):
+    help = (
+        "Create or regenerate the per-language reporting views of models with"
+        " translated fields."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            metavar="app_label[.ModelName]",
+            help="Limit the views to the given apps or models.",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop the views instead of creating them.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to create the views in.",
+        )
+
+    def handle(self, *, labels, drop, database, **options):
+        for model in self._models(labels):
+            if drop:
+                drop_views(model, using=database)
+                self.stdout.write(f"{model._meta.label}: dropped views")
+            else:
+                names = regenerate_views(model, using=database)
+                self.stdout.write(f"{model._meta.label}: {', '.join(names)}")
+
+    def _models(self, labels):
+        return [
+            model
+            for model in labeled_models(labels)
+            if model._meta.managed
+            and not model._meta.proxy
+            and _translated_fields(model)
+        ]
@@ -0,0 +1,284 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.db.models import Q
+
+from translated_fields.fields import _auxiliary_fields_for, _is_empty, to_attribute
+from translated_fields.query import _translated_field
+from translated_fields.search import _sync_index
+
+
+__all__ = ["StubBackend", "TranslationBackend", "apretranslate", "pretranslate"]
+
+
+class TranslationBackend:
+    """
+    Base class for machine translation backends
+
+    Backends implement ``translate`` which receives a list of texts and returns
+    the list of translated texts in the same order. Exceptions raised by
+    ``translate`` cause the batch to be retried.
+    """
+
+    async def translate(self, texts, *, source, target):
+        raise NotImplementedError
+
+
+class StubBackend(TranslationBackend):
+    """
+    Local backend which prefixes texts with the target language code, useful
+    for testing
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    async def translate(self, texts, *, source, target):
+        self.requests.append((source, target, list(texts)))
+        return [f"[{target}] {text}" for text in texts]
+
+
+class _RateLimiter:
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate else 0
+        self.lock = asyncio.Lock()
+        self.next = 0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self.lock:
+            now = asyncio.get_running_loop().time()
+            if self.next > now:
+                await asyncio.sleep(self.next - now)
+            self.next = max(now, self.next) + self.interval
+
+
+async def _translate_batches(
+    backend, batches, *, concurrency, rate, retries, retry_delay
+):
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = _RateLimiter(rate)
+
+    async def translate(source, target, texts):
+        async with semaphore:
+            for attempt in range(retries + 1):
+                await limiter.wait()
+                try:
+                    translated = await backend.translate(
+                        texts, source=source, target=target
+                    )
+                except Exception:
+                    if attempt == retries:
+                        raise
+                    await asyncio.sleep(retry_delay * 2**attempt)
+                else:
+                    if len(translated) != len(texts):
+                        raise ValueError(
+                            f"Backend returned {len(translated)} translations"
+                            f" for {len(texts)} texts."
+                        )
+                    return source, target, texts, translated
+
+    tasks = [asyncio.ensure_future(translate(*batch)) for batch in batches]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # Do not leave sibling batches running when one of them fails
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class _Pretranslation:
+    """
+    State of a ``pretranslate`` job; loading and saving chunks is synchronous,
+    translating them is asynchronous
+    """
+
+    def __init__(self, queryset, names, *, source, targets, chunk_size, batch_size):
+        self.model = queryset.model
+        self.db = queryset.db
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.pairs = []
+        self.fields = []
+        q = Q()
+        for name in names:
+            field = _translated_field(self.model, name)
+            self.fields.append(field)
+            field_source = source or field.languages[0]
+            for target in targets or field.languages:
+                if target == field_source or target not in field.languages:
+                    continue
+                attribute = to_attribute(name, target)
+                self.pairs.append(
+                    (to_attribute(name, field_source), field_source, attribute, target)
+                )
+                q |= Q(**{attribute: ""}) | Q(**{f"{attribute}__isnull": True})
+        columns = {column for pair in self.pairs for column in (pair[0], pair[2])}
+        # Computed columns and the columns they are computed from
+        columns.update(_auxiliary_fields_for(self.model, columns))
+        columns.update(
+            field.fields[0] for field in self.fields if field._auxiliary_fields()
+        )
+        self.queryset = queryset.filter(q).only(*columns).order_by("pk")
+        self.last = None
+
+    def next_chunk(self):
+        """
+        Load the next chunk and return a ``(wanted, batches)`` tuple, ``None``
+        when done
+        """
+        if not self.pairs:
+            return None
+        queryset = self.queryset
+        if self.last is not None:
+            queryset = queryset.filter(pk__gt=self.last)
+        chunk = list(queryset[: self.chunk_size])
+        if not chunk:
+            return None
+        self.last = chunk[-1].pk
+
+        # {(source, target): {text: [(obj, attribute), ...]}}
+        wanted = {}
+        for obj in chunk:
+            for source_attribute, source_language, attribute, target in self.pairs:
+                text = getattr(obj, source_attribute)
+                if not _is_empty(text) and _is_empty(getattr(obj, attribute)):
+                    wanted.setdefault((source_language, target), {}).setdefault(
+                        text, []
+                    ).append((obj, attribute))
+
+        batches = []
+        for (source_language, target), texts in wanted.items():
+            unique = list(texts)
+            batches.extend(
+                (source_language, target, unique[i : i + self.batch_size])
+                for i in range(0, len(unique), self.batch_size)
+            )
+        return wanted, batches
+
+    def save(self, wanted, results):
+        """Write the translations back and return the number of updated objects"""
+        changed = {}
+        fields = set()
+        for source_language, target, texts, translated in results:
+            for text, translation in zip(texts, translated):
+                for obj, attribute in wanted[source_language, target][text]:
+                    setattr(obj, attribute, translation)
+                    changed[obj.pk] = obj
+                    fields.add(attribute)
+        if changed:
+            # bulk_update() doesn't send pre_save
+            for obj in changed.values():
+                for field in self.fields:
+                    field._update_auxiliary_fields(obj)
+            self.model._base_manager.using(self.db).bulk_update(
+                changed.values(),
+                [*sorted(fields), *_auxiliary_fields_for(self.model, fields)],
+            )
+            _sync_index(self.model, changed, fields, using=self.db)
+        return len(changed)
+
+
+def pretranslate(
+    queryset,
+    names,
+    backend,
+    *,
+    source=None,
+    targets=None,
+    chunk_size=500,
+    batch_size=50,
+    concurrency=4,
+    rate=None,
+    retries=3,
+    retry_delay=1,
+):
+    """
+    Fill empty translations of the translated fields ``names`` using
+    ``backend`` and return the number of updated objects
+
+    Objects are processed in chunks of ``chunk_size`` objects. Texts are
+    deduplicated per chunk and sent to the backend in batches of up to
+    ``batch_size`` texts per (source, target) language pair. Up to
+    ``concurrency`` batches are in flight at the same time and at most
+    ``rate`` batches per second are started if ``rate`` is given. Failing
+    batches are retried up to ``retries`` times with exponential backoff.
+
+    The source language defaults to the first language of each field, the
+    target languages to all other languages of each field.
+
+    This function runs its own event loop and cannot be called from
+    asynchronous code, use ``apretranslate`` there.
+    """
+    job = _Pretranslation(
+        queryset,
+        names,
+        source=source,
+        targets=targets,
+        chunk_size=chunk_size,
+        batch_size=batch_size,
+    )
+    loop = asyncio.new_event_loop()
+    count = 0
+    try:
+        while chunk := job.next_chunk():
+            wanted, batches = chunk
+            results = loop.run_until_complete(
+                _translate_batches(
+                    backend,
+                    batches,
+                    concurrency=concurrency,
+                    rate=rate,
+                    retries=retries,
+                    retry_delay=retry_delay,
+                )
+            )
+            count += job.save(wanted, results)
+    finally:
+        loop.close()
+    return count
+
+
+async def apretranslate(
+    queryset,
+    names,
+    backend,
+    *,
+    source=None,
+    targets=None,
+    chunk_size=500,
+    batch_size=50,
+    concurrency=4,
+    rate=None,
+    retries=3,
+    retry_delay=1,
+):
+    """
+    Asynchronous variant of ``pretranslate`` using the running event loop;
+    database queries run in a thread using ``sync_to_async``
+    """
+    job = await sync_to_async(_Pretranslation)(
+        queryset,
+        names,
+        source=source,
+        targets=targets,
+        chunk_size=chunk_size,
+        batch_size=batch_size,
+    )
+    count = 0
+    while chunk := await sync_to_async(job.next_chunk)():
+        wanted, batches = chunk
+        results = await _translate_batches(
+            backend,
+            batches,
+            concurrency=concurrency,
+            rate=rate,
+            retries=retries,
+            retry_delay=retry_delay,
+        )
+        count += await sync_to_async(job.save)(wanted, results)
+    return count
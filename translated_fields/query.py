@@ -0,0 +1,486 @@
+import functools
+import weakref
+from itertools import islice
+
+from django.core.exceptions import FieldError
+from django.db import connections, models
+from django.db.models.query import ModelIterable
+from django.utils.translation import get_language
+
+from translated_fields.fields import (
+    GeneratedField,
+    TranslatedField,
+    _resolved_expression,
+    _translated_attnames,
+    _translated_fields,
+    served_languages,
+    to_attribute,
+)
+from translated_fields.search import (
+    _reindex,
+    _searchable_columns,
+    search,
+    search_backend,
+    update_index,
+)
+
+
+__all__ = [
+    "BatchedDeferredLoadingMixin",
+    "FromTranslationsMixin",
+    "ServedLanguagesManagerMixin",
+    "TranslatedQuerySet",
+]
+
+
+def _translated_field(model, name):
+    field = getattr(model, name, None)
+    if not isinstance(field, TranslatedField):
+        raise FieldError(
+            f"'{name}' is not a translated field of '{model._meta.label}'."
+        )
+    return field
+
+
+def _language_attributes(name, field, language_code=None, *, fallback=True):
+    language = language_code or get_language()
+    languages = [language] if language in field.languages else []
+    if language in field.aliases:
+        languages.append(field.aliases[language])
+    if fallback or not languages:
+        languages.append((served_languages(field.languages) or field.languages)[0])
+    return list(dict.fromkeys(to_attribute(name, language) for language in languages))
+
+
+def _unserved_fields(model):
+    fields = []
+    for field in _translated_fields(model).values():
+        served = served_languages(field.languages)
+        fields.extend(
+            attribute
+            for language, attribute in zip(field.languages, field.fields)
+            if language not in served
+        )
+    return fields
+
+
+class ServedLanguagesManagerMixin:
+    """
+    Manager mixin which defers the fields of languages not listed in the
+    ``TRANSLATED_FIELDS_SERVED_LANGUAGES`` setting
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if fields := _unserved_fields(self.model):
+            queryset = queryset.defer(*fields)
+        return queryset
+
+
+class BatchedDeferredLoadingMixin:
+    """
+    Model mixin which loads a deferred translated field for all instances
+    fetched by the same ``TranslatedQuerySet`` at once instead of running one
+    query per instance
+    """
+
+    # Maximum number of primary keys per query
+    batched_loading_size = 1000
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Weak references cannot be pickled
+        state.pop("_translated_peers", None)
+        return state
+
+    def refresh_from_db(self, using=None, fields=None, *args, **kwargs):
+        peers = self.__dict__.get("_translated_peers")
+        fields = list(fields or ())
+        if (
+            peers is None
+            or len(fields) != 1
+            or fields[0] not in _translated_attnames(self.__class__)
+        ):
+            return super().refresh_from_db(using, fields or None, *args, **kwargs)
+
+        attname = fields[0]
+        instances = {self.pk: self}
+        for ref in peers:
+            obj = ref()
+            if (
+                obj is not None
+                and attname not in obj.__dict__
+                and obj._state.db == self._state.db
+            ):
+                instances.setdefault(obj.pk, obj)
+
+        manager = self.__class__._base_manager.db_manager(using or self._state.db)
+        pks = list(instances)
+        for i in range(0, len(pks), self.batched_loading_size):
+            for pk, value in manager.filter(
+                pk__in=pks[i : i + self.batched_loading_size]
+            ).values_list("pk", attname):
+                obj = instances[pk]
+                setattr(obj, attname, value)
+                if (snapshot := obj.__dict__.get("_translated_snapshot")) is not None:
+                    # Loaded, not changed (see DirtyTrackingMixin)
+                    snapshot[attname] = value
+
+        if attname not in self.__dict__:
+            # Deleted in the meantime, let Django raise the appropriate error
+            return super().refresh_from_db(using, fields, *args, **kwargs)
+
+
+@functools.cache
+def _language_attnames(model):
+    """Return a ``{name: {language_code: attname}}`` dict of translated fields"""
+    return {
+        name: {
+            language: model._meta.get_field(column).attname
+            for language, column in zip(field.languages, field.fields)
+        }
+        for name, field in _translated_fields(model).items()
+    }
+
+
+def _unknown_languages(model, rows):
+    attnames = _language_attnames(model)
+    return sorted(
+        {
+            f"{name}: {language}"
+            for row in rows
+            for name, values in row.items()
+            if name in attnames
+            for language in values
+            if language not in attnames[name]
+        }
+    )
+
+
+def _translated_kwargs(attnames, row):
+    kwargs = {}
+    for name, value in row.items():
+        if (languages := attnames.get(name)) is None:
+            kwargs[name] = value
+        else:
+            for language, language_value in value.items():
+                kwargs[languages[language]] = language_value
+    return kwargs
+
+
+def _from_translations(model, rows):
+    attnames = _language_attnames(model)
+    try:
+        return [model(**_translated_kwargs(attnames, row)) for row in rows]
+    except KeyError:
+        # Report all unknown languages at once
+        if unknown := _unknown_languages(model, rows):
+            raise ValueError(
+                f"Unknown languages for '{model._meta.label}': {', '.join(unknown)}"
+            ) from None
+        raise
+
+
+class FromTranslationsMixin:
+    """
+    Model mixin adding a ``from_translations`` constructor which accepts
+    ``{language_code: value}`` dicts for translated fields
+    """
+
+    @classmethod
+    def from_translations(cls, **kwargs):
+        """
+        Return an unsaved instance, e.g.
+        ``Question.from_translations(question={"en": "Why?", "de": "Warum?"})``
+        """
+        return _from_translations(cls, [kwargs])[0]
+
+
+class LanguageModelIterable(ModelIterable):
+    """Bind the queryset's language to all instances"""
+
+    def __iter__(self):
+        language = self.queryset._translated_language
+        for obj in super().__iter__():
+            obj._translated_language = language
+            yield obj
+
+
+def _other_language_fields(model, language_code):
+    fields = []
+    for name, field in _translated_fields(model).items():
+        keep = set(_language_attributes(name, field, language_code))
+        fields.extend(column for column in field.fields if column not in keep)
+        language = field.aliases.get(language_code, language_code)
+        fields.extend(
+            column
+            for other, column in field.resolved_fields.items()
+            if other != language
+        )
+    return fields
+
+
+class TranslatedQuerySet(models.QuerySet):
+    _translated_language = None
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._translated_language = self._translated_language
+        return clone
+
+    def with_language(self, language_code):
+        """
+        Bind ``language_code`` to the returned instances instead of using the
+        active language and defer the columns of all other languages except
+        for the fallback language
+
+        Pass ``None`` to use the active language again.
+        """
+        clone = self._chain()
+        clone._translated_language = language_code
+        if language_code is None:
+            clone._iterable_class = ModelIterable
+        else:
+            clone._iterable_class = LanguageModelIterable
+            if fields := _other_language_fields(self.model, language_code):
+                clone = clone.defer(*fields)
+        return clone
+
+    def _fetch_all(self):
+        fetch = self._result_cache is None
+        super()._fetch_all()
+        if (
+            fetch
+            and len(self._result_cache) > 1
+            and issubclass(self._iterable_class, ModelIterable)
+            and issubclass(self.model, BatchedDeferredLoadingMixin)
+            and self.query.deferred_loading != (frozenset(), True)
+        ):
+            peers = [weakref.ref(obj) for obj in self._result_cache]
+            for obj in self._result_cache:
+                obj._translated_peers = peers
+
+    def select_related_translated(self, *names, language_code=None, fallback=True):
+        """
+        Join the related objects of the active language only (and of the
+        fallback language if ``fallback`` is true) instead of all languages
+        """
+        return self.select_related(
+            *(
+                attribute
+                for name in names
+                for attribute in _language_attributes(
+                    name,
+                    _translated_field(self.model, name),
+                    language_code,
+                    fallback=fallback,
+                )
+            )
+        )
+
+    def prefetch_related_translated(
+        self, *names, queryset=None, language_code=None, fallback=True
+    ):
+        """
+        Same as ``select_related_translated`` but using ``prefetch_related``,
+        optionally with a custom ``queryset`` for the related objects
+        """
+        return self.prefetch_related(
+            *(
+                models.Prefetch(attribute, queryset=queryset)
+                for name in names
+                for attribute in _language_attributes(
+                    name,
+                    _translated_field(self.model, name),
+                    language_code,
+                    fallback=fallback,
+                )
+            )
+        )
+
+    def _resolved_name(self, name):
+        """
+        Replace a leading translated field name in ``name`` (a lookup or an
+        ordering, optionally prefixed with ``-``) with its resolved column
+        """
+        prefix = "-" if name.startswith("-") else ""
+        field_name, sep, rest = name.removeprefix(prefix).partition("__")
+        field = getattr(self.model, field_name, None)
+        if not isinstance(field, TranslatedField) or field.packed:
+            return name
+        attribute = field.resolved_attribute(self._translated_language)
+        return f"{prefix}{attribute}{sep}{rest}"
+
+    def filter_translated(self, *args, **kwargs):
+        """
+        ``filter()`` resolving translated field names to the resolved column
+        of the bound or active language (see ``resolved_attribute``), e.g.
+        ``filter_translated(name__startswith="A")``
+        """
+        return self.filter(
+            *args,
+            **{self._resolved_name(name): value for name, value in kwargs.items()},
+        )
+
+    def exclude_translated(self, *args, **kwargs):
+        """``exclude()`` variant of ``filter_translated``"""
+        return self.exclude(
+            *args,
+            **{self._resolved_name(name): value for name, value in kwargs.items()},
+        )
+
+    def order_by_translated(self, *names):
+        """
+        ``order_by()`` resolving translated field names like
+        ``filter_translated``, e.g. ``order_by_translated("-name", "pk")``
+        """
+        return self.order_by(
+            *(
+                self._resolved_name(name) if isinstance(name, str) else name
+                for name in names
+            )
+        )
+
+    def refresh_resolved(self, *names):
+        """
+        Recompute the resolved columns of the translated fields ``names`` (all
+        translated fields if empty) using a single ``UPDATE`` query and return
+        the number of updated rows
+
+        This is only necessary for updates which bypass ``Model.save()`` on
+        Django versions without ``GeneratedField``; generated columns are
+        always computed by the database.
+        """
+        if GeneratedField is not None:
+            return 0
+        fields = (
+            [_translated_field(self.model, name) for name in names]
+            if names
+            else _translated_fields(self.model).values()
+        )
+        updates = {
+            attribute: _resolved_expression(
+                field._field, to_attribute(field.name, language), field.fields[0]
+            )
+            for field in fields
+            for language, attribute in field.resolved_fields.items()
+        }
+        return self.update(**updates) if updates else 0
+
+    def stale_translations(self, language_code, *names):
+        """
+        Return objects whose ``language_code`` translation of any of the
+        translated fields ``names`` (all fields declared with
+        ``track_sources`` if empty) is stale, i.e. the source value has changed
+        after the translation has been written
+        """
+        if names:
+            fields = [_translated_field(self.model, name) for name in names]
+            if untracked := [field.name for field in fields if not field.source_fields]:
+                raise FieldError(
+                    f"{', '.join(untracked)} of '{self.model._meta.label}'"
+                    " do not track sources."
+                )
+        else:
+            fields = [
+                field
+                for field in _translated_fields(self.model).values()
+                if field.source_fields
+            ]
+        q = models.Q()
+        for field in fields:
+            if language_code in field.source_fields:
+                q |= models.Q(**{field.source_fields[language_code][1]: True})
+        return self.filter(q) if q else self.none()
+
+    def _syncs_search(self, fields):
+        """Return whether writing ``fields`` has to update the search index"""
+        return bool(
+            set(fields).intersection(_searchable_columns(self.model))
+            and search_backend(connections[self.db]) is not None
+        )
+
+    def bulk_create(self, objs, batch_size=None, ignore_conflicts=False, **kwargs):  # noqa: FBT002
+        kwargs.update(batch_size=batch_size, ignore_conflicts=ignore_conflicts)
+        if not self._syncs_search(_searchable_columns(self.model)):
+            return super().bulk_create(objs, **kwargs)
+
+        objs = list(objs)
+        queryset = self.model._base_manager.using(self.db)
+        # Primary keys aren't returned by all backends and conflicting rows
+        # aren't written, index the inserted rows as stored in the database
+        refetch = (
+            ignore_conflicts
+            or kwargs.get("update_conflicts")
+            or not connections[self.db].features.can_return_rows_from_bulk_insert
+        )
+        if refetch:
+            last = queryset.order_by("-pk").values_list("pk", flat=True).first()
+        objs = super().bulk_create(objs, **kwargs)
+        if not refetch:
+            update_index(self.model, objs, using=self.db)
+            return objs
+
+        pks = {obj.pk for obj in objs if obj.pk is not None}
+        if last is not None:
+            queryset = queryset.filter(pk__gt=last)
+        pks.update(queryset.values_list("pk", flat=True))
+        _reindex(self.model, sorted(pks), using=self.db)
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        count = super().bulk_update(objs, fields, *args, **kwargs)
+        if self._syncs_search(fields):
+            update_index(self.model, objs, using=self.db)
+        return count
+
+    def update(self, **kwargs):
+        if not self._syncs_search(kwargs):
+            return super().update(**kwargs)
+        pks = list(self.values_list("pk", flat=True))
+        count = super().update(**kwargs)
+        _reindex(self.model, pks, using=self.db)
+        return count
+
+    def search_translated(self, name, query, *, language=None):
+        """
+        Return the primary keys of objects in this queryset whose translated
+        field ``name`` matches ``query`` in ``language`` (the language bound
+        using ``with_language`` or the active language by default) using the
+        full-text search index, best matches first
+        """
+        pks = search(
+            self.model,
+            name,
+            query,
+            language=language or self._translated_language or get_language(),
+            using=self.db,
+        )
+        if not self.query.has_filters() or not pks:
+            return pks
+        matches = set()
+        for i in range(0, len(pks), 500):
+            matches.update(
+                self.filter(pk__in=pks[i : i + 500]).values_list("pk", flat=True)
+            )
+        return [pk for pk in pks if pk in matches]
+
+    def bulk_create_translated(self, rows, *, batch_size=1000, **kwargs):
+        """
+        Create objects from an iterable of dicts containing
+        ``{language_code: value}`` dicts for translated fields and values for
+        all other fields using ``bulk_create`` and return the number of
+        created objects
+
+        Rows are consumed ``batch_size`` rows at a time, large iterables do not
+        have to be held in memory. Remaining keyword arguments are passed on to
+        ``bulk_create``.
+        """
+        count = 0
+        rows = iter(rows)
+        while batch := list(islice(rows, batch_size)):
+            count += len(
+                self.bulk_create(_from_translations(self.model, batch), **kwargs)
+            )
+        return count
@@ -0,0 +1,251 @@
+from django.apps import apps
+from django.conf import settings
+from django.conf.locale import LANG_INFO
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.operations.base import Operation
+
+from translated_fields.fields import _is_text, _translated_fields, to_attribute
+
+
+__all__ = [
+    "CreateTranslatedViews",
+    "create_views",
+    "drop_views",
+    "regenerate_views",
+    "view_languages",
+    "view_name",
+    "view_sql",
+]
+
+
+def view_languages(model):
+    """
+    Return the languages of all translated fields of ``model`` including
+    language aliases
+    """
+    return list(
+        dict.fromkeys(
+            language
+            for field in _translated_fields(model).values()
+            for language in [*field.languages, *field.aliases]
+        )
+    )
+
+
+def view_name(model, language_code):
+    """Return the name of the view of ``model`` for ``language_code``"""
+    return to_attribute(model._meta.db_table, language_code)
+
+
+def _column(model, attribute):
+    try:
+        return model._meta.get_field(attribute).column
+    except FieldDoesNotExist:
+        return None
+
+
+def _columns(model, field, language_code):
+    """
+    Return the existing columns of ``field`` which are tried in order for
+    ``language_code``
+    """
+    languages = []
+    if language_code in field.aliases:
+        if language_code in field.alias_overrides:
+            languages.append(language_code)
+        languages.append(field.aliases[language_code])
+    elif language_code in field.languages:
+        languages.append(language_code)
+    languages.append(field.languages[0])
+    columns = (
+        _column(model, to_attribute(field.name, language))
+        for language in dict.fromkeys(languages)
+    )
+    return [column for column in columns if column is not None]
+
+
+def view_sql(model, language_code, connection):
+    """
+    Return the ``SELECT`` statement of the view of ``model`` for
+    ``language_code``
+
+    Each translated field is exposed as a single column named after the field
+    falling back to the first language for empty values. Other columns
+    created for translated fields are omitted.
+    """
+    return _view_sql(model, _translated_fields(model), language_code, connection)
+
+
+def _view_sql(model, fields, language_code, connection):
+    """
+    Return the view's ``SELECT`` statement for the columns of ``model``, which
+    may be a historical model, and the translated ``fields``
+    """
+    qn = connection.ops.quote_name
+    translated = {
+        column
+        for field in fields.values()
+        for column in [
+            *field.fields,
+            *field.resolved_fields.values(),
+            *(attr for attrs in field.source_fields.values() for attr in attrs),
+        ]
+    }
+    select = [
+        qn(field.column)
+        for field in model._meta.concrete_fields
+        if field.name not in translated
+    ]
+    for name, field in fields.items():
+        columns = _columns(model, field, language_code)
+        if not columns:
+            continue
+        expressions = [
+            f"NULLIF({qn(column)}, '')" if _is_text(field._field) else qn(column)
+            for column in columns[:-1]
+        ]
+        # Empty values of the first language stay empty
+        expressions.append(qn(columns[-1]))
+        expression = (
+            f"COALESCE({', '.join(expressions)})"
+            if len(expressions) > 1
+            else expressions[0]
+        )
+        alias = f"{name}_id" if field._field.is_relation else name
+        select.append(f"{expression} AS {qn(alias)}")
+    return f"SELECT {', '.join(select)} FROM {qn(model._meta.db_table)}"
+
+
+def _execute(statements, using):
+    with connections[using].cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+
+
+def _drop_statements(model, languages, connection):
+    qn = connection.ops.quote_name
+    return [
+        f"DROP VIEW IF EXISTS {qn(view_name(model, language))}"
+        for language in languages or view_languages(model)
+    ]
+
+
+def _create_statements(model, languages, connection, *, fields=None):
+    qn = connection.ops.quote_name
+    if fields is None:
+        fields = _translated_fields(model)
+    statements = _drop_statements(model, languages, connection)
+    statements.extend(
+        f"CREATE VIEW {qn(view_name(model, language))}"
+        f" AS {_view_sql(model, fields, language, connection)}"
+        for language in languages or view_languages(model)
+    )
+    return statements
+
+
+def drop_views(model, *, languages=None, using=DEFAULT_DB_ALIAS):
+    """
+    Drop the views of ``model`` for ``languages`` (all languages of the
+    model's translated fields by default)
+    """
+    _execute(_drop_statements(model, languages, connections[using]), using)
+
+
+def create_views(model, *, languages=None, using=DEFAULT_DB_ALIAS):
+    """
+    Create or replace the views of ``model`` for ``languages`` (all languages
+    of the model's translated fields by default) and return their names
+    """
+    _execute(_create_statements(model, languages, connections[using]), using)
+    return [
+        view_name(model, language) for language in languages or view_languages(model)
+    ]
+
+
+def regenerate_views(model, *, using=DEFAULT_DB_ALIAS):
+    """
+    Drop all existing language views of ``model``, also those of languages
+    which have been removed, and create the views of the current languages
+
+    Only views named after known language codes (``LANGUAGES`` and all
+    languages Django has information about) are dropped.
+    """
+    connection = connections[using]
+    candidates = {
+        view_name(model, language)
+        for language in [
+            *view_languages(model),
+            *(code for code, _name in settings.LANGUAGES),
+            *LANG_INFO,
+        ]
+    }
+    with connection.cursor() as cursor:
+        existing = [
+            info.name
+            for info in connection.introspection.get_table_list(cursor)
+            if info.type == "v" and info.name in candidates
+        ]
+    qn = connection.ops.quote_name
+    _execute([f"DROP VIEW IF EXISTS {qn(name)}" for name in existing], using)
+    return create_views(model, using=using)
+
+
+class CreateTranslatedViews(Operation):
+    """
+    Migration operation creating the per-language views of a model
+
+    The translated fields and languages are taken from the current model
+    definition, the columns from the migration state; columns which do not
+    exist yet at this point of the migration history are left out. Add the
+    operation again (or run the ``translated_views`` management command) when
+    languages change.
+    """
+
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(self, model_name, languages=None):
+        self.model_name = model_name
+        self.languages = languages
+
+    def deconstruct(self):
+        kwargs = {"model_name": self.model_name}
+        if self.languages is not None:
+            kwargs["languages"] = self.languages
+        return (self.__class__.__qualname__, [], kwargs)
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def _languages(self, app_label):
+        if self.languages is not None:
+            return self.languages
+        return view_languages(apps.get_model(app_label, self.model_name))
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        # Historical models have no translated fields, only their columns
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            for sql in _create_statements(
+                model,
+                self._languages(app_label),
+                schema_editor.connection,
+                fields=_translated_fields(apps.get_model(app_label, self.model_name)),
+            ):
+                schema_editor.execute(sql, params=None)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            for sql in _drop_statements(
+                model, self._languages(app_label), schema_editor.connection
+            ):
+                schema_editor.execute(sql, params=None)
+
+    def describe(self):
+        return f"Create translated views of {self.model_name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"translated_views_{self.model_name.lower()}"
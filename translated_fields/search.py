@@ -0,0 +1,361 @@
+from django.apps import apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, NotSupportedError, connections
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.utils.module_loading import import_string
+
+from translated_fields.fields import (
+    _is_empty,
+    _translated_fields,
+    to_attribute,
+)
+
+
+__all__ = [
+    "FTS5Backend",
+    "SearchBackend",
+    "create_index",
+    "drop_index",
+    "rebuild_index",
+    "search",
+    "search_backend",
+    "update_index",
+]
+
+
+_DEFAULT_BACKENDS = {"sqlite": "translated_fields.search.FTS5Backend"}
+
+
+def _searchable_fields(model):
+    """Return a ``{name: TranslatedField}`` dict of searchable fields"""
+    return {
+        name: field
+        for name, field in _translated_fields(model).items()
+        if field.searchable
+    }
+
+
+def _index_languages(model):
+    return list(
+        dict.fromkeys(
+            language
+            for field in _searchable_fields(model).values()
+            for language in field.languages
+        )
+    )
+
+
+def search_backend(connection):
+    """
+    Return the search backend for ``connection`` as configured in the
+    ``TRANSLATED_FIELDS_SEARCH_BACKENDS`` setting, a ``{vendor: dotted path}``
+    dict, or ``None`` if the database isn't supported
+    """
+    backends = {
+        **_DEFAULT_BACKENDS,
+        **getattr(settings, "TRANSLATED_FIELDS_SEARCH_BACKENDS", {}),
+    }
+    if path := backends.get(connection.vendor):
+        return import_string(path)(connection)
+    return None
+
+
+class SearchBackend:
+    """
+    Interface of search backends maintaining one full-text index per model
+    and language
+
+    Documents are identified by the primary key and contain the values of the
+    model's searchable translated fields.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def create(self, model, languages):
+        """Create the indexes of ``languages`` if they do not exist yet"""
+        raise NotImplementedError
+
+    def drop(self, model, languages):
+        """Drop the indexes of ``languages``"""
+        raise NotImplementedError
+
+    def is_current(self, model, languages):
+        """
+        Return whether the indexes of ``languages`` exist and contain the
+        model's searchable fields
+        """
+        raise NotImplementedError
+
+    def index(self, model, language, documents):
+        """
+        Add or replace ``documents``, a ``{pk: {name: text}}`` dict, in the
+        index of ``language``
+        """
+        raise NotImplementedError
+
+    def delete(self, model, languages, pks):
+        """Remove the documents of ``pks`` from the indexes of ``languages``"""
+        raise NotImplementedError
+
+    def search(self, model, language, name, query):
+        """
+        Return the primary keys of documents whose field ``name`` matches
+        ``query`` in the index of ``language``, best matches first
+        """
+        raise NotImplementedError
+
+
+class FTS5Backend(SearchBackend):
+    """
+    SQLite FTS5 backend using a virtual table ``<db_table>_search_<language>``
+    per language
+
+    The primary key is used as the ``rowid`` and therefore has to be an
+    integer.
+    """
+
+    tokenize = "unicode61 remove_diacritics 2"
+
+    def _table(self, model, language):
+        return self.connection.ops.quote_name(
+            to_attribute(f"{model._meta.db_table}_search", language)
+        )
+
+    def _execute(self, sql, params=()):
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall() if cursor.description else None
+
+    def create(self, model, languages):
+        qn = self.connection.ops.quote_name
+        columns = ", ".join(qn(name) for name in _searchable_fields(model))
+        for language in languages:
+            self._execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self._table(model, language)}"
+                f" USING fts5({columns}, tokenize = '{self.tokenize}')"
+            )
+
+    def drop(self, model, languages):
+        for language in languages:
+            self._execute(f"DROP TABLE IF EXISTS {self._table(model, language)}")
+
+    def is_current(self, model, languages):
+        tables = set(self.connection.introspection.table_names())
+        names = list(_searchable_fields(model))
+        for language in languages:
+            table = to_attribute(f"{model._meta.db_table}_search", language)
+            if table not in tables:
+                return False
+            with self.connection.cursor() as cursor:
+                cursor.execute(f"SELECT * FROM {self._table(model, language)} LIMIT 0")
+                if [column[0] for column in cursor.description] != names:
+                    return False
+        return True
+
+    def index(self, model, language, documents):
+        if not documents:
+            return
+        self.delete(model, [language], list(documents))
+        qn = self.connection.ops.quote_name
+        names = list(_searchable_fields(model))
+        with self.connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {self._table(model, language)}"
+                f" (rowid, {', '.join(qn(name) for name in names)})"
+                f" VALUES (%s, {', '.join('%s' for _name in names)})",
+                [
+                    [pk, *(document.get(name, "") for name in names)]
+                    for pk, document in documents.items()
+                ],
+            )
+
+    def delete(self, model, languages, pks):
+        # Stay below SQLite's limit of query parameters
+        for i in range(0, len(pks), 500):
+            chunk = pks[i : i + 500]
+            for language in languages:
+                self._execute(
+                    f"DELETE FROM {self._table(model, language)}"
+                    f" WHERE rowid IN ({', '.join('%s' for _pk in chunk)})",
+                    chunk,
+                )
+
+    def search(self, model, language, name, query):
+        # Quote all terms, FTS5 query syntax isn't exposed to users
+        terms = " ".join(
+            '"{}"'.format(term.replace('"', '""')) for term in query.split()
+        )
+        if not terms:
+            return []
+        table = self._table(model, language)
+        qn = self.connection.ops.quote_name
+        return [
+            row[0]
+            for row in self._execute(
+                f"SELECT rowid FROM {table} WHERE {qn(name)} MATCH %s ORDER BY rank",
+                [terms],
+            )
+        ]
+
+
+def _backend(using):
+    backend = search_backend(connections[using])
+    if backend is None:
+        raise NotSupportedError(
+            f"No search backend for '{connections[using].vendor}' databases."
+        )
+    return backend
+
+
+def _documents(model, objs, language):
+    fields = _searchable_fields(model)
+    documents = {}
+    for obj in objs:
+        document = {}
+        for name, field in fields.items():
+            if language not in field.languages:
+                continue
+            # Empty values fall back to the primary language like resolved
+            # columns do
+            value = getattr(obj, to_attribute(name, language))
+            if _is_empty(value):
+                value = getattr(obj, field.fields[0])
+            document[name] = value or ""
+        documents[obj.pk] = document
+    return documents
+
+
+def create_index(model, *, using=DEFAULT_DB_ALIAS):
+    """Create the search indexes of ``model`` if they do not exist yet"""
+    _backend(using).create(model, _index_languages(model))
+
+
+def drop_index(model, *, using=DEFAULT_DB_ALIAS):
+    """Drop the search indexes of ``model``"""
+    _backend(using).drop(model, _index_languages(model))
+
+
+def update_index(model, objs, *, using=DEFAULT_DB_ALIAS):
+    """Add or replace ``objs`` in the search indexes of ``model``"""
+    backend = _backend(using)
+    for language in _index_languages(model):
+        backend.index(model, language, _documents(model, objs, language))
+
+
+def _searchable_columns(model):
+    return [
+        column
+        for field in _searchable_fields(model).values()
+        for column in field.fields
+    ]
+
+
+def _reindex(model, pks, *, chunk_size=1000, using=DEFAULT_DB_ALIAS):
+    """Update the search indexes for the objects with primary keys ``pks``"""
+    queryset = model._base_manager.using(using).only(*_searchable_columns(model))
+    for i in range(0, len(pks), chunk_size):
+        update_index(
+            model, queryset.filter(pk__in=pks[i : i + chunk_size]), using=using
+        )
+
+
+def _sync_index(model, pks, fields, *, using=DEFAULT_DB_ALIAS):
+    """
+    Update the search indexes for the objects with primary keys ``pks``
+    after writing the columns ``fields`` without sending signals
+    """
+    if (
+        set(fields).intersection(_searchable_columns(model))
+        and search_backend(connections[using]) is not None
+    ):
+        _reindex(model, list(pks), using=using)
+
+
+def rebuild_index(model, *, chunk_size=1000, using=DEFAULT_DB_ALIAS):
+    """
+    Recreate the search indexes of ``model`` from scratch, loading
+    ``chunk_size`` rows at a time, and return the number of indexed rows
+    """
+    drop_index(model, using=using)
+    create_index(model, using=using)
+    queryset = (
+        model._base_manager.using(using)
+        .only(*_searchable_columns(model))
+        .order_by("pk")
+    )
+    count = 0
+    last = None
+    while True:
+        objs = list(
+            (queryset if last is None else queryset.filter(pk__gt=last))[:chunk_size]
+        )
+        if not objs:
+            return count
+        update_index(model, objs, using=using)
+        count += len(objs)
+        last = objs[-1].pk
+
+
+def search(model, name, query, *, language, using=DEFAULT_DB_ALIAS):
+    """
+    Return the primary keys of ``model`` objects whose translated field
+    ``name`` matches ``query`` in ``language``, best matches first
+    """
+    field = _searchable_fields(model).get(name)
+    if field is None:
+        raise ValueError(
+            f"'{name}' is not a searchable field of '{model._meta.label}'."
+        )
+    language = field.aliases.get(language, language)
+    if language not in field.languages:
+        language = field.languages[0]
+    return _backend(using).search(model, language, name, query)
+
+
+def _search_models():
+    return [
+        model
+        for model in apps.get_models()
+        if not model._meta.proxy and _searchable_fields(model)
+    ]
+
+
+def _post_save(sender, *, instance, using, raw, **kwargs):
+    if not raw and search_backend(connections[using]) is not None:
+        update_index(sender, [instance], using=using)
+
+
+def _post_delete(sender, instance, using, **kwargs):
+    if (backend := search_backend(connections[using])) is not None:
+        backend.delete(sender, _index_languages(sender), [instance.pk])
+
+
+def _post_migrate(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    if (backend := search_backend(connections[using])) is None:
+        return
+    for model in _search_models():
+        if model._meta.app_config is sender and not backend.is_current(
+            model, _index_languages(model)
+        ):
+            # Missing indexes or changed searchable fields or languages
+            rebuild_index(model, using=using)
+
+
+def _connect_signals():
+    for model in _search_models():
+        post_migrate.connect(
+            _post_migrate,
+            sender=model._meta.app_config,
+            dispatch_uid=f"translated_fields_search_{model._meta.app_label}",
+        )
+        post_save.connect(
+            _post_save,
+            sender=model,
+            dispatch_uid=f"translated_fields_search_{model._meta.label}",
+        )
+        post_delete.connect(
+            _post_delete,
+            sender=model,
+            dispatch_uid=f"translated_fields_search_{model._meta.label}",
+        )
@@ -0,0 +1,7 @@
+from django.dispatch import Signal
+
+
+# Sent after saving an instance of a model using ``DirtyTrackingMixin`` when
+# translated columns have changed. Receivers get the ``instance`` and
+# ``changes``, a set of ``(name, language_code)`` tuples.
+translations_changed = Signal()
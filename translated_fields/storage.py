@@ -0,0 +1,210 @@
+import hashlib
+import operator
+import os
+import posixpath
+import weakref
+from functools import partial, reduce
+
+from django.apps import apps
+from django.core.files import File
+from django.core.files.storage import Storage, default_storage
+from django.db import connections, transaction
+from django.db.models import FileField, Q
+from django.db.models.signals import post_delete
+from django.utils.deconstruct import deconstructible
+
+
+__all__ = ["ContentAddressedStorage"]
+
+
+@deconstructible(path="translated_fields.storage.ContentAddressedStorage")
+class ContentAddressedStorage(Storage):
+    """
+    Storage wrapper which stores files under the hash of their content
+
+    Identical uploads are only stored once, whatever the language, field or
+    row they have been uploaded for. Files are only deleted when no row
+    references them anymore. Wraps ``storage`` or the default storage.
+    """
+
+    def __init__(self, storage=None, *, prefix="cas", algorithm="sha256"):
+        self._storage = storage
+        self.prefix = prefix
+        self.algorithm = algorithm
+
+    @property
+    def storage(self):
+        return self._storage or default_storage
+
+    def content_name(self, name, content):
+        """
+        Return the name of ``content`` which is read in chunks for hashing
+        """
+        digest = hashlib.new(self.algorithm)
+        if hasattr(content, "seek"):
+            content.seek(0)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        if hasattr(content, "seek"):
+            content.seek(0)
+        hexdigest = digest.hexdigest()
+        ext = os.path.splitext(name)[1].lower()
+        return posixpath.join(self.prefix, hexdigest[:2], f"{hexdigest}{ext}")
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+        name = self.content_name(name, content)
+        if self.storage.exists(name):
+            # Identical content has already been stored
+            return name
+        return self.storage.save(name, content, max_length=max_length)
+
+    def shares_files(self, other):
+        """
+        Return whether ``other`` stores its files in the same place, i.e. wraps
+        the same storage and uses the same prefix
+        """
+        return (
+            isinstance(other, ContentAddressedStorage)
+            and other.storage is self.storage
+            and other.prefix == self.prefix
+        )
+
+    def referenced(self, names, *, using=None):
+        """
+        Return the set of ``names`` which are referenced by any row in a file
+        field using a storage sharing files with this storage
+
+        Runs one query per model and chunk of names.
+        """
+        names = list(dict.fromkeys(names))
+        fields = {}
+        for model, field in _file_fields(self):
+            fields.setdefault(model, []).append(field.attname)
+        found = set()
+        for model, attnames in fields.items():
+            queryset = model._base_manager.using(using)
+            # Stay below SQLite's limit of query parameters
+            size = max(1, 500 // len(attnames))
+            for i in range(0, len(names), size):
+                chunk = names[i : i + size]
+                rows = queryset.filter(
+                    reduce(
+                        operator.or_,
+                        (Q(**{f"{attname}__in": chunk}) for attname in attnames),
+                    )
+                ).values_list(*attnames)
+                for row in rows:
+                    found.update(row)
+        return found.intersection(names)
+
+    def is_referenced(self, name):
+        """Return whether any row references ``name``, see ``referenced``"""
+        return bool(self.referenced([name]))
+
+    def delete(self, name):
+        """Delete ``name`` unless it is still referenced"""
+        if name and not self.is_referenced(name):
+            self.storage.delete(name)
+
+    def _delete_unreferenced(self, names, *, using=None):
+        referenced = self.referenced(names, using=using)
+        for name in names:
+            if name not in referenced:
+                self.storage.delete(name)
+
+    def cleanup(self):
+        """
+        Delete all stored files which aren't referenced anymore, e.g. after
+        ``FieldFile.delete()`` or after replacing files, and return their names
+        """
+        deleted = []
+        if not self.storage.exists(self.prefix):
+            return deleted
+        directories, _files = self.storage.listdir(self.prefix)
+        for directory in directories:
+            path = posixpath.join(self.prefix, directory)
+            names = [
+                posixpath.join(path, file) for file in self.storage.listdir(path)[1]
+            ]
+            referenced = self.referenced(names)
+            for name in names:
+                if name not in referenced:
+                    self.storage.delete(name)
+                    deleted.append(name)
+        return deleted
+
+    def exists(self, name):
+        return self.storage.exists(name)
+
+    def _open(self, name, mode="rb"):
+        return self.storage.open(name, mode)
+
+    def listdir(self, path):
+        return self.storage.listdir(path)
+
+    def size(self, name):
+        return self.storage.size(name)
+
+    def url(self, name):
+        return self.storage.url(name)
+
+    def path(self, name):
+        return self.storage.path(name)
+
+    def get_accessed_time(self, name):
+        return self.storage.get_accessed_time(name)
+
+    def get_created_time(self, name):
+        return self.storage.get_created_time(name)
+
+    def get_modified_time(self, name):
+        return self.storage.get_modified_time(name)
+
+
+def _file_fields(storage=None):
+    return [
+        (model, field)
+        for model in apps.get_models()
+        for field in model._meta.concrete_fields
+        if isinstance(field, FileField)
+        and isinstance(field.storage, ContentAddressedStorage)
+        and (storage is None or storage.shares_files(field.storage))
+    ]
+
+
+# {connection: {storage: {name, ...}}} of files of deleted rows
+_released = weakref.WeakKeyDictionary()
+
+
+def _delete_released(connection):
+    for storage, names in _released.pop(connection, {}).items():
+        storage._delete_unreferenced(sorted(names), using=connection.alias)
+
+
+def _delete_files(sender, instance, using, **kwargs):
+    connection = connections[using]
+    released = _released.setdefault(connection, {})
+    for field in sender._meta.concrete_fields:
+        if (
+            isinstance(field, FileField)
+            and isinstance(field.storage, ContentAddressedStorage)
+            and (name := getattr(instance, field.attname).name)
+        ):
+            released.setdefault(field.storage, set()).add(name)
+    # Files are checked once per transaction when it is committed, rolled
+    # back deletions still reference their files. Later callbacks of the
+    # same transaction find nothing to do.
+    transaction.on_commit(partial(_delete_released, connection), using=using)
+
+
+def _connect_signals():
+    for model in {model for model, _field in _file_fields()}:
+        post_delete.connect(
+            _delete_files,
+            sender=model,
+            dispatch_uid=f"translated_fields_storage_{model._meta.label}",
+        )
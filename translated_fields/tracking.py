@@ -0,0 +1,155 @@
+from django.db import DatabaseError, router, transaction
+from django.db.models.fields.files import FieldFile
+
+from translated_fields.fields import _auxiliary_fields_for, _translated_attnames
+from translated_fields.signals import translations_changed
+
+
+__all__ = ["DirtyTrackingMixin"]
+
+
+def _comparable(value):
+    # Saving a file changes the name of the FieldFile instance in place.
+    return value.name if isinstance(value, FieldFile) else value
+
+
+def _snapshot(obj, attnames):
+    return {
+        attname: _comparable(obj.__dict__[attname])
+        for attname in attnames
+        if attname in obj.__dict__
+    }
+
+
+class DirtyTrackingMixin:
+    """
+    Model mixin which tracks changes to translated columns
+
+    Saving an existing object without ``update_fields`` only writes the
+    translated columns which have changed since the object has been loaded or
+    saved. The ``translations_changed`` signal reports the changed
+    ``(name, language_code)`` pairs after saving.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        obj = super().from_db(db, field_names, values)
+        obj._translated_snapshot = _snapshot(obj, _translated_attnames(cls))
+        obj._translated_pk = obj.pk
+        return obj
+
+    def refresh_from_db(self, using=None, fields=None, *args, **kwargs):
+        super().refresh_from_db(using, fields, *args, **kwargs)
+        attnames = _translated_attnames(self.__class__)
+        if fields is not None:
+            fields = {self._meta.get_field(name).attname for name in fields}
+            attnames = [attname for attname in attnames if attname in fields]
+        snapshot = self.__dict__.setdefault("_translated_snapshot", {})
+        snapshot.update(_snapshot(self, attnames))
+        self._translated_pk = self.pk
+
+    def changed_translations(self):
+        """
+        Return the set of ``(name, language_code)`` pairs of translated
+        columns which have been changed since the object has been loaded or
+        saved (all loaded columns of objects which aren't saved yet)
+        """
+        return {
+            _translated_attnames(self.__class__)[attname]
+            for attname in self._changed_translated_attnames()
+        }
+
+    def _changed_translated_attnames(self):
+        snapshot = self.__dict__.get("_translated_snapshot")
+        if (
+            snapshot is None
+            or self._state.adding
+            # Copied, e.g. by setting pk = None
+            or self.pk is None
+            or self.pk != self.__dict__.get("_translated_pk")
+        ):
+            return set(_snapshot(self, _translated_attnames(self.__class__)))
+        return {
+            attname
+            for attname, value in _snapshot(
+                self, _translated_attnames(self.__class__)
+            ).items()
+            # Columns loaded later without refresh_from_db count as changed
+            if attname not in snapshot or snapshot[attname] != value
+        }
+
+    def _updates_loaded_row(self, args, kwargs):
+        """
+        Return whether saving updates the row the object has been loaded
+        from or saved to, e.g. not after setting ``pk = None`` to copy it
+        """
+        return (
+            kwargs.get("update_fields") is None
+            and not args
+            and not kwargs.get("force_insert")
+            and not self._state.adding
+            and "_translated_snapshot" in self.__dict__
+            and self.pk is not None
+            and self.pk == self.__dict__.get("_translated_pk")
+        )
+
+    def save(self, *args, **kwargs):
+        attnames = _translated_attnames(self.__class__)
+        changed = self._changed_translated_attnames()
+        update_fields = kwargs.get("update_fields")
+        if derived := self._updates_loaded_row(args, kwargs):
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = update_fields = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not getattr(field, "generated", False)
+                and field.attname not in deferred
+                and (field.attname not in attnames or field.attname in changed)
+            ]
+        elif update_fields is not None:
+            # Columns computed by pre_save from the written columns
+            kwargs["update_fields"] = update_fields = list(
+                dict.fromkeys(
+                    [
+                        *update_fields,
+                        *_auxiliary_fields_for(self.__class__, update_fields),
+                    ]
+                )
+            )
+            fields = {self._meta.get_field(name).attname for name in update_fields}
+            changed = {attname for attname in changed if attname in fields}
+
+        if derived:
+            using = kwargs.get("using") or router.db_for_write(
+                self.__class__, instance=self
+            )
+            try:
+                with transaction.atomic(using=using):
+                    super().save(*args, **kwargs)
+            except DatabaseError:
+                if (
+                    self.__class__._base_manager.using(using)
+                    .filter(pk=self.pk)
+                    .exists()
+                ):
+                    raise
+                # The row has been deleted in the meantime, insert it again
+                # like Model.save() does
+                del kwargs["update_fields"]
+                update_fields = None
+                super().save(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
+
+        saved = _snapshot(self, attnames)
+        if update_fields is not None:
+            saved = {attname: saved[attname] for attname in changed}
+        self.__dict__.setdefault("_translated_snapshot", {}).update(saved)
+        self._translated_pk = self.pk
+        if changed:
+            translations_changed.send(
+                sender=self.__class__,
+                instance=self,
+                changes={attnames[attname] for attname in changed},
+            )
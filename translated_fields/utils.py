@@ -1,11 +1,22 @@
+import functools
+
+from django.core.exceptions import FieldDoesNotExist
 from django.utils.functional import keep_lazy_text
 from django.utils.text import capfirst
 
-from translated_fields.fields import TranslatedField, to_attribute
+from translated_fields.fields import (
+    TranslatedField,
+    _language_value,
+    _served_field_languages,
+    instance_language,
+    to_attribute,
+    translated_attrgetter,
+)
 
 
 __all__ = [
     "TranslatedFieldWithFallback",
+    "cached_attrgetter",
     "fallback_to_default",
     "fallback_to_any",
     "language_code_formfield_callback",
@@ -14,19 +25,37 @@ __all__ = [
 
 def fallback_to_default(name, field):
     def getter(self):
-        return getattr(self, to_attribute(name), None) or getattr(
-            self, to_attribute(name, field.languages[0])
-        )
+        languages = _served_field_languages(field) or field.languages
+        current = instance_language(self)
+        language = field.aliases.get(current, current)
+        if (
+            (attribute := field.resolved_fields.get(language))
+            and attribute in self.__dict__
+            and to_attribute(name, language) not in self.__dict__
+            and languages[0] == field.languages[0]
+            and current not in field.alias_overrides
+        ):
+            # The language's column is deferred, use the resolved value
+            return self.__dict__[attribute]
+        if language in languages or language not in field.languages:
+            value = _language_value(self, name, field, current, None)
+            if value:
+                return value
+        return getattr(self, to_attribute(name, languages[0]))
 
     return getter
 
 
 def fallback_to_any(name, field):
     def getter(self):
-        current = getattr(self, to_attribute(name), None)
-        if current:
-            return current
-        for language in field.languages:
+        languages = _served_field_languages(field)
+        current = instance_language(self)
+        language = field.aliases.get(current, current)
+        if language in languages or language not in field.languages:
+            value = _language_value(self, name, field, current, None)
+            if value:
+                return value
+        for language in languages:
             value = getattr(self, to_attribute(name, language))
             if value:
                 return value
@@ -35,6 +64,62 @@ def fallback_to_any(name, field):
     return getter
 
 
+_MISSING = object()
+
+
+@functools.cache
+def _dependency_attnames(cls, attributes):
+    """Return the keys of ``attributes`` in the ``__dict__`` of instances"""
+    if not hasattr(cls, "_meta"):
+        return attributes
+    attnames = []
+    for attribute in attributes:
+        try:
+            attnames.append(cls._meta.get_field(attribute).attname)
+        except FieldDoesNotExist:
+            attnames.append(attribute)
+    return tuple(attnames)
+
+
+def cached_attrgetter(attrgetter=translated_attrgetter, *, depends_on=(), maxsize=32):
+    """
+    Wrap ``attrgetter`` so that its results are cached per instance and
+    language
+
+    Cached values are recomputed when the per-language attributes of the
+    field or the attributes listed in ``depends_on`` change. At most
+    ``maxsize`` values are cached per instance, the least recently used are
+    evicted first.
+    """
+
+    def factory(name, field):
+        getter = attrgetter(name, field)
+        attributes = (
+            *(to_attribute(name, language) for language in field.languages),
+            *depends_on,
+        )
+
+        def cached_getter(self):
+            attnames = _dependency_attnames(self.__class__, attributes)
+            key = (name, instance_language(self))
+            cache = self.__dict__.setdefault("_translated_cache", {})
+            values = tuple(self.__dict__.get(attname, _MISSING) for attname in attnames)
+            if (entry := cache.pop(key, None)) is not None and entry[0] == values:
+                cache[key] = entry
+                return entry[1]
+            value = getter(self)
+            # The getter may have loaded deferred fields
+            values = tuple(self.__dict__.get(attname, _MISSING) for attname in attnames)
+            cache[key] = (values, value)
+            if len(cache) > maxsize:
+                del cache[next(iter(cache))]
+            return value
+
+        return cached_getter
+
+    return factory
+
+
 class TranslatedFieldWithFallback(TranslatedField):
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("attrgetter", fallback_to_default)